@@ -5,6 +5,7 @@ ONE RESPONSIBILITY: Load and save user settings to a JSON file
 
 import json
 import os
+import threading
 
 CONFIG_FILE = os.path.expanduser("~/.macos_multitool_prefs.json")
 
@@ -15,28 +16,77 @@ DEFAULT_CONFIG = {
     "window_height": 850
 }
 
+# (mtime_ns, config) of the last file read; reused while the file is unchanged
+_cache = None
+
+# Pending debounced write
+_save_timer = None
+_save_lock = threading.Lock()
+# Serializes the file writes themselves (timer thread vs. synchronous saves)
+_write_lock = threading.Lock()
+
 def load_config():
     """Load configuration from file, falling back to defaults."""
-    if not os.path.exists(CONFIG_FILE):
+    global _cache
+
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
         return DEFAULT_CONFIG.copy()
 
+    if _cache and _cache[0] == mtime:
+        return _cache[1].copy()
+
     try:
         with open(CONFIG_FILE, 'r') as f:
             user_config = json.load(f)
             # Merge with defaults to ensure all keys exist
             config = DEFAULT_CONFIG.copy()
             config.update(user_config)
-            return config
+            _cache = (mtime, config)
+            return config.copy()
     except Exception as e:
         print(f"Error loading config: {e}")
         return DEFAULT_CONFIG.copy()
 
+def _write_config(config):
+    """Write the config atomically so an interrupted save never leaves a torn file."""
+    global _cache
+    tmp_path = CONFIG_FILE + ".tmp"
+    with _write_lock:
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(config, f, indent=4)
+            os.replace(tmp_path, CONFIG_FILE)
+            _cache = None
+            return True
+        except Exception as e:
+            print(f"Error saving config: {e}")
+            return False
+
 def save_config(config):
-    """Save configuration to file."""
-    try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
-        return True
-    except Exception as e:
-        print(f"Error saving config: {e}")
-        return False
+    """Save configuration to file, superseding any pending debounced save."""
+    global _save_timer
+    with _save_lock:
+        timer = _save_timer
+        _save_timer = None
+    if timer:
+        timer.cancel()
+        # A timer that already fired may be mid-write; let it finish first
+        timer.join()
+    return _write_config(config)
+
+def save_config_debounced(config, delay=0.5):
+    """
+    Save configuration after `delay` seconds without further calls.
+
+    Rapid changes (slider drags, mode toggles) collapse into a single write
+    made off the calling thread.
+    """
+    global _save_timer
+    with _save_lock:
+        if _save_timer:
+            _save_timer.cancel()
+        _save_timer = threading.Timer(delay, _write_config, args=(dict(config),))
+        _save_timer.daemon = True
+        _save_timer.start()
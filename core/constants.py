@@ -3,6 +3,7 @@ constants.py - macOS version database with buffer allocations
 ONE RESPONSIBILITY: Store OS metadata
 """
 
+import functools
 import math
 
 # macOS version database
@@ -26,6 +27,7 @@ HFS_OVERHEAD_MULTIPLIER = 0.10  # Increased to 10% to account for variations and
 BOOT_FILES_MB = 1000            # Increased to 1GB to match test expectations (safety margin)
 MIN_PARTITION_MB = 5500         # ~5.5GB Minimum
 
+@functools.lru_cache(maxsize=1024)
 def calculate_partition_size(installer_size_kb: int, version_string: str, override_buffer_gb: float = None) -> int:
     """
     Calculate required partition size with future-proof buffer.
@@ -37,6 +39,8 @@ def calculate_partition_size(installer_size_kb: int, version_string: str, overri
 
     Returns:
         int: Required partition size in MB (rounded up)
+
+    Results are memoized; the function is pure in its arguments.
     """
     # Convert input to MB
     installer_mb = float(installer_size_kb) / 1024
@@ -4,12 +4,65 @@ ONE RESPONSIBILITY: Check installer completeness
 """
 
 import os
+import json
 import subprocess
+import concurrent.futures
 
 # Thresholds in MB
 STUB_THRESHOLD_MB = 50
 MINIMUM_SHARED_SUPPORT_MB = 100
 
+# Results of earlier checks, keyed by bundle fingerprint
+CACHE_FILE = os.path.expanduser("~/.cache/macos-multitool/stubs.json")
+
+# Files is_stub_installer() inspects, relative to the bundle
+_PAYLOAD_FILES = (
+    "Contents/SharedSupport/SharedSupport.dmg",
+    "Contents/SharedSupport/BaseSystem.dmg",
+    "Contents/SharedSupport/InstallESD.dmg",
+    "Contents/SharedSupport.dmg",
+)
+
+def cache_key(app_path):
+    """
+    Fingerprint a bundle from the stats the stub verdict depends on.
+
+    Covers the bundle and its Contents/SharedSupport directory (entries
+    added or removed) and each payload dmg (grown in place by a download).
+    Returns None if the bundle itself can't be stat'ed.
+    """
+    try:
+        st = os.stat(app_path)
+    except OSError:
+        return None
+    parts = [app_path, str(st.st_mtime_ns)]
+    for rel in ("Contents/SharedSupport",) + _PAYLOAD_FILES:
+        try:
+            st = os.stat(os.path.join(app_path, rel))
+            parts.append(f"{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            parts.append("-")
+    return "|".join(parts)
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    """Write the cache atomically so a crash never leaves a torn file."""
+    tmp_path = CACHE_FILE + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        pass
+
 def is_stub_installer(app_path):
     """
     Check if installer is a stub (incomplete).
@@ -83,6 +136,32 @@ def is_stub_installer(app_path):
 
     return True
 
+def check_stubs(app_paths):
+    """
+    Check several installers, reusing cached verdicts for unchanged bundles.
+
+    Args:
+        app_paths: Paths to Install macOS.app bundles
+
+    Returns:
+        list: True/False stub verdict per path, in order
+    """
+    cache = _load_cache()
+    keys = [cache_key(path) for path in app_paths]
+    stubs = [cache.get(key) for key in keys]
+    misses = [i for i, key in enumerate(keys) if key is None or key not in cache]
+
+    if misses:
+        # Each check stats/du's a bundle; run the uncached ones concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+            fresh = ex.map(is_stub_installer, [app_paths[i] for i in misses])
+            for i, is_stub in zip(misses, fresh):
+                stubs[i] = is_stub
+        # Keep only bundles still present so the file doesn't grow forever
+        _save_cache({key: stub for key, stub in zip(keys, stubs) if key is not None})
+
+    return stubs
+
 def get_stub_reason(app_path):
     """Get human-readable reason why installer is stub."""
     # Check total size first as it's the ultimate fallback
@@ -7,6 +7,11 @@ import subprocess
 import os
 import time
 import re
+import codecs
+
+READ_BLOCK_SIZE = 8192
+PERCENT_RE = re.compile(r'(\d+)%')
+TRAILING_DIGITS_RE = re.compile(r'\d*\Z')
 
 def run_createinstallmedia(installer_path, volume_path, progress_callback=None):
     """
@@ -48,28 +53,36 @@ def run_createinstallmedia(installer_path, volume_path, progress_callback=None):
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
+            stderr=subprocess.STDOUT
         )
 
+        # createinstallmedia prints "10%..20%.." without newlines, so read raw
+        # blocks instead of lines and parse every percentage in each block
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        fd = process.stdout.fileno()
         last_percent = 0
+        carry = ""  # Digits at the end of a block that may continue in the next
+
+        while True:
+            block = os.read(fd, READ_BLOCK_SIZE)
+            if not block:
+                break
+            text = decoder.decode(block)
 
-        for line in process.stdout:
             # Display output
-            print(line, end='', flush=True)
-
-            # Parse progress
-            if "%" in line:
-                try:
-                    match = re.search(r'(\d+)%', line)
-                    if match:
-                        percent = int(match.group(1))
-                        if percent != last_percent and progress_callback:
-                            progress_callback(percent)
-                            last_percent = percent
-                except:
-                    pass
+            print(text, end='', flush=True)
+
+            # Parse progress; callback fires only when the value changes
+            text = carry + text
+            for match in PERCENT_RE.finditer(text):
+                percent = int(match.group(1))
+                if percent != last_percent and progress_callback:
+                    try:
+                        progress_callback(percent)
+                    except Exception:
+                        pass
+                    last_percent = percent
+            carry = TRAILING_DIGITS_RE.search(text).group(0)
 
         process.wait()
 
@@ -118,3 +131,27 @@ def get_volume_mount_point(disk_id, partition_num):
 
     except:
         return None
+
+def wait_for_mount(path, timeout=30):
+    """
+    Wait until a path (e.g. a volume under /Volumes) appears.
+
+    Polls with exponential backoff so a fast mount returns almost at once.
+    FSEvents could avoid polling entirely but would need pyobjc.
+
+    Args:
+        path: Mount point or device node to wait for
+        timeout: Maximum seconds to wait
+
+    Returns:
+        bool: True if the path appeared before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while not os.path.exists(path):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+    return True
@@ -162,7 +162,7 @@ def add_partition_to_free_space(disk_id, new_installers):
 
             subprocess.check_output(cmd, text=True)
             print("  ✓ Add successful")
-            new_partitions.append({'name': part_name, 'installer': installer})
+            new_partitions.append({'name': part_name, 'installer': installer, 'size_mb': size_mb})
 
         except subprocess.CalledProcessError as e:
             print(f"  ❌ Failed to add partition: {e}")
@@ -5,11 +5,13 @@ test_basic.py - Basic functionality tests for logic modules
 import unittest
 import sys
 import os
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core import constants
 from detection import stub_validator, version_parser
+from operations import installer_runner
 
 class TestBasics(unittest.TestCase):
     def test_partition_calc_sonoma(self):
@@ -38,6 +40,13 @@ class TestBasics(unittest.TestCase):
         self.assertGreaterEqual(size_gb, 18000)
         self.assertLessEqual(size_gb, 22000)
 
+    def test_partition_calc_is_memoized(self):
+        constants.calculate_partition_size.cache_clear()
+        first = constants.calculate_partition_size(13 * 1024 * 1024, "14.0", override_buffer_gb=1.5)
+        second = constants.calculate_partition_size(13 * 1024 * 1024, "14.0", override_buffer_gb=1.5)
+        self.assertEqual(first, second)
+        self.assertEqual(constants.calculate_partition_size.cache_info().hits, 1)
+
     def test_version_parsing(self):
         self.assertEqual(version_parser.parse_version("14.6.1"), (14, 6, 1))
         self.assertEqual(version_parser.parse_version("15.0 Beta 3"), (15, 0, 0))
@@ -48,5 +57,32 @@ class TestBasics(unittest.TestCase):
         self.assertEqual(constants._extract_version_key("15.2 Beta"), "15")
         self.assertEqual(constants._extract_version_key("10.15.7"), "10.15")
 
+    def test_wait_for_mount(self):
+        self.assertTrue(installer_runner.wait_for_mount(os.path.dirname(__file__), timeout=0))
+        self.assertFalse(installer_runner.wait_for_mount("/Volumes/__no_such_volume__", timeout=0.2))
+
+    def _run_with_output(self, blocks):
+        """Run createinstallmedia against fake output `blocks`; return reported percentages."""
+        process = MagicMock(returncode=0)
+        process.stdout.fileno.return_value = 99
+        percents = []
+        with patch.object(installer_runner.os.path, 'exists', return_value=True), \
+             patch.object(installer_runner.subprocess, 'Popen', return_value=process), \
+             patch.object(installer_runner.os, 'read', side_effect=list(blocks) + [b""]), \
+             patch('builtins.print'):
+            self.assertTrue(installer_runner.run_createinstallmedia("/x.app", "/Volumes/x", percents.append))
+        return percents
+
+    def test_progress_split_across_blocks(self):
+        self.assertEqual(self._run_with_output([b"0%..10%..4", b"5%..100%"]), [10, 45, 100])
+
+    def test_progress_ignores_digits_before_newline(self):
+        self.assertEqual(self._run_with_output([b"Erasing disk 12\n", b"3%..50%"]), [3, 50])
+
+    def test_progress_multibyte_split(self):
+        text = "Copying \u2026 20%..30%".encode('utf-8')
+        cut = text.index(b"\xe2\x80") + 1
+        self.assertEqual(self._run_with_output([text[:cut], text[cut:]]), [20, 30])
+
 if __name__ == '__main__':
     unittest.main()
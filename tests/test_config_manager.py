@@ -0,0 +1,66 @@
+"""
+test_config_manager.py - Tests for persistent preference handling
+"""
+
+import unittest
+from unittest.mock import patch
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import config_manager
+
+class TestConfigManager(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.config_file = os.path.join(self.tmp_dir, "prefs.json")
+        patcher = patch.object(config_manager, 'CONFIG_FILE', self.config_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config_manager._cache = None
+
+    def test_load_reuses_cache_while_file_unchanged(self):
+        with open(self.config_file, 'w') as f:
+            json.dump({"default_buffer": 1.5}, f)
+
+        first = config_manager.load_config()
+        self.assertEqual(first["default_buffer"], 1.5)
+
+        # Mutating the returned dict must not leak into the cache
+        first["default_buffer"] = 9.0
+        with patch('builtins.open', side_effect=AssertionError("file re-read")):
+            second = config_manager.load_config()
+        self.assertEqual(second["default_buffer"], 1.5)
+
+    def test_debounced_save_writes_once(self):
+        config = config_manager.DEFAULT_CONFIG.copy()
+        with patch.object(config_manager, '_write_config', wraps=config_manager._write_config) as write:
+            for buf in (1.0, 1.1, 1.2):
+                config["default_buffer"] = buf
+                config_manager.save_config_debounced(config, delay=0.05)
+            time.sleep(0.3)
+
+        self.assertEqual(write.call_count, 1)
+        self.assertEqual(config_manager.load_config()["default_buffer"], 1.2)
+
+    def test_save_supersedes_pending_debounced_save(self):
+        config = config_manager.DEFAULT_CONFIG.copy()
+        config["default_buffer"] = 1.0
+        config_manager.save_config_debounced(config, delay=0.05)
+        config["default_buffer"] = 3.0
+        self.assertTrue(config_manager.save_config(config))
+        time.sleep(0.2)
+
+        self.assertEqual(config_manager.load_config()["default_buffer"], 3.0)
+        self.assertEqual(os.listdir(self.tmp_dir), ["prefs.json"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -88,6 +88,7 @@ class MockTreeview(MockWidget):
     def see(self, item): pass
     def set(self, item, col, value=None): return "value"
     def tag_configure(self, tag, **kwargs): pass
+    def tag_has(self, tagname, item=None): return []
     def identify(self, region, x, y): return "region"
     def identify_column(self, x): return "#1"
     def identify_row(self, y): return "item_id"
@@ -0,0 +1,125 @@
+"""
+test_logger.py - Tests for the logging setup
+"""
+
+import unittest
+from unittest.mock import patch
+import importlib.util
+import logging
+import os
+import shutil
+import sys
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# test_gui_integration replaces utils.logger in sys.modules with a mock, so
+# load the real module from its file without going through the import cache
+_spec = importlib.util.spec_from_file_location(
+    "utils.logger",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "utils", "logger.py"))
+logger = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(logger)
+
+class TestLogger(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        patcher = patch.object(logger, 'LOG_DIR', self.tmp_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        root = logging.getLogger()
+        self._saved_handlers = root.handlers[:]
+        self._saved_level = root.level
+        self._saved_raise = logging.raiseExceptions
+        self.addCleanup(self._restore_root)
+
+    def _restore_root(self):
+        logger.shutdown()
+        root = logging.getLogger()
+        for handler in root.handlers:
+            handler.close()
+        root.handlers = self._saved_handlers
+        root.setLevel(self._saved_level)
+        logging.raiseExceptions = self._saved_raise
+
+    def _read_log(self):
+        with open(logger.get_log_file(), 'r') as f:
+            return f.read()
+
+    def test_errors_reach_disk_once_dequeued(self):
+        logger.setup_logging()
+        logger.log_info("routine message")
+        logger.log_error("something broke")
+        # Stopping the listener waits for the queue to drain but leaves the file open
+        logger._listener.stop()
+        contents = self._read_log()
+        self.assertIn("routine message", contents)
+        self.assertIn("something broke", contents)
+        logger._listener.start()
+
+    def test_shutdown_flushes_buffered_records(self):
+        logger.setup_logging()
+        logger.log_info("buffered message")
+        logger.shutdown()
+        self.assertIn("buffered message", self._read_log())
+        self.assertIn(" - INFO - buffered message", self._read_log())
+
+    def test_setup_twice_keeps_logging(self):
+        logger.setup_logging()
+        logger.setup_logging()
+        logger.log_info("after second setup")
+        logger.shutdown()
+        self.assertIn("after second setup", self._read_log())
+
+    def test_lazy_helper_formats_only_enabled_levels(self):
+        logger.setup_logging()
+        logger.log_info_lazy("copied %d of %d", 3, 7)
+        with patch.object(logger, '_INFO_ON', False):
+            logger.log_info_lazy("suppressed %s", "message")
+            logger.log_info("suppressed too")
+        logger.shutdown()
+        contents = self._read_log()
+        self.assertIn(" - INFO - copied 3 of 7", contents)
+        self.assertNotIn("suppressed", contents)
+
+    def test_console_queue_drops_oldest_and_reports(self):
+        q = logger.DropOldestQueue(2)
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual(q.dropped, 3)
+        self.assertEqual([q.get_nowait(), q.get_nowait()], [3, 4])
+
+        class Collect(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.messages = []
+
+            def emit(self, record):
+                self.messages.append(record.getMessage())
+
+        sink = Collect()
+        listener = logger.ConsoleListener(q, sink)
+        for i in range(4):
+            q.put_nowait(logging.makeLogRecord({'msg': f"line {i}"}))
+        listener.start()
+        listener.stop()
+        self.assertEqual(sink.messages, ["5 log records dropped (console too slow)", "line 2", "line 3"])
+        self.assertEqual(q.dropped, 0)
+
+    def test_fast_formatter_matches_standard_layout(self):
+        standard = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        fast = logger.FastFormatter()
+        record = logging.LogRecord("root", logging.WARNING, __file__, 1, "disk %s full", ("disk4",), None)
+        self.assertEqual(fast.format(record), standard.format(record))
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("root", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+        self.assertEqual(fast.format(record), standard.format(record))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import unittest
 import os
 import shutil
 import tempfile
+from unittest.mock import patch
 from detection import stub_validator
 
 class TestStubValidator(unittest.TestCase):
@@ -33,5 +34,41 @@ class TestStubValidator(unittest.TestCase):
         # We expect False (Not a stub)
         self.assertFalse(is_stub, "Should be FULL installer because BaseSystem.dmg exists")
 
+    def test_cache_round_trip(self):
+        cache_file = os.path.join(self.test_dir, "cache", "stubs.json")
+        with patch.object(stub_validator, 'CACHE_FILE', cache_file):
+            self.assertEqual(stub_validator._load_cache(), {})
+
+            key = stub_validator.cache_key(self.app_path)
+            stub_validator._save_cache({key: True})
+            self.assertEqual(stub_validator._load_cache(), {key: True})
+
+        # Fingerprint changes when the bundle is touched
+        os.utime(self.app_path, ns=(0, 0))
+        self.assertNotEqual(stub_validator.cache_key(self.app_path), key)
+        self.assertIsNone(stub_validator.cache_key(os.path.join(self.test_dir, "missing.app")))
+
+    def test_check_stubs_reuses_cached_verdicts(self):
+        cache_file = os.path.join(self.test_dir, "cache", "stubs.json")
+        with patch.object(stub_validator, 'CACHE_FILE', cache_file):
+            self.assertEqual(stub_validator.check_stubs([self.app_path]), [True])
+            with patch.object(stub_validator, 'is_stub_installer', side_effect=AssertionError("re-checked")):
+                self.assertEqual(stub_validator.check_stubs([self.app_path]), [True])
+
+    def test_cache_key_changes_when_payload_grows(self):
+        key = stub_validator.cache_key(self.app_path)
+        payload = os.path.join(self.app_path, "Contents/SharedSupport/SharedSupport.dmg")
+        with open(payload, "wb") as f:
+            f.write(b"0" * 1024)
+        grown = stub_validator.cache_key(self.app_path)
+        self.assertNotEqual(grown, key)
+
+        # A download finishing in place only changes the file's size
+        st = os.stat(payload)
+        with open(payload, "ab") as f:
+            f.write(b"0" * 1024)
+        os.utime(payload, ns=(st.st_atime_ns, st.st_mtime_ns))
+        self.assertNotEqual(stub_validator.cache_key(self.app_path), grown)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,101 @@
+"""
+test_virtual_tree.py - Model-level tests for the windowed Treeview
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import importlib.util
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class FakeTreeview:
+    """Just enough of ttk.Treeview to record what VirtualTree renders."""
+
+    def __init__(self, parent=None, **kwargs):
+        self.items = {}
+        self.row_box = None
+
+    def bind(self, event, func): pass
+    def after_idle(self, func): func()
+    def get_children(self, item=None): return tuple(self.items)
+    def exists(self, iid): return iid in self.items
+    def delete(self, *iids):
+        for iid in iids:
+            del self.items[iid]
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self.items[iid] = values
+        return iid
+    def item(self, iid, values=None):
+        self.items[iid] = values
+    def bbox(self, iid):
+        return self.row_box
+
+fake_ttk = MagicMock()
+fake_ttk.Treeview = FakeTreeview
+fake_ttk.Style.return_value.lookup.return_value = ""
+fake_tk = MagicMock()
+fake_tk.TclError = Exception
+fake_tk.ttk = fake_ttk
+
+# Load the component against the fake widget without touching the real
+# tkinter (or the mocks other test modules install in sys.modules)
+with patch.dict(sys.modules, {'tkinter': fake_tk, 'tkinter.ttk': fake_ttk}):
+    _spec = importlib.util.spec_from_file_location(
+        "virtual_tree",
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                     "ui", "components", "virtual_tree.py"))
+    virtual_tree = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(virtual_tree)
+
+class TestVirtualTree(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = virtual_tree.VirtualTree(None, height=5)
+        self.scrollbar = MagicMock()
+        self.tree.attach_scrollbar(self.scrollbar)
+        self.tree.set_model([(f"row {i}", "") for i in range(100)])
+
+    def rendered(self):
+        return [int(iid) for iid in self.tree.get_children()]
+
+    def test_set_model_renders_first_window(self):
+        self.assertEqual(self.rendered(), [0, 1, 2, 3, 4])
+        self.scrollbar.set.assert_called_with(0.0, 0.05)
+
+    def test_set_row_value(self):
+        self.tree.set_row_value(2, 1, "✓")
+        self.assertEqual(self.tree.items["2"], ("row 2", "✓"))
+        # Off-screen rows only change in the model
+        self.tree.set_row_value(50, 1, "✓")
+        self.assertNotIn("50", self.tree.items)
+        self.tree.yview("moveto", "0.5")
+        self.assertEqual(self.tree.items["50"], ("row 50", "✓"))
+
+    def test_yview_scroll_and_clamp(self):
+        self.tree.yview("scroll", "3", "units")
+        self.assertEqual(self.rendered(), [3, 4, 5, 6, 7])
+        self.tree.yview("scroll", "1", "pages")
+        self.assertEqual(self.rendered()[0], 8)
+        self.tree.yview("moveto", "1.0")
+        self.assertEqual(self.rendered(), [95, 96, 97, 98, 99])
+        self.assertEqual(self.tree.yview(), (0.95, 1.0))
+        self.tree.yview("scroll", "-50", "pages")
+        self.assertEqual(self.rendered()[0], 0)
+
+    def test_visible_rows_follow_measured_row_height(self):
+        # 30 px rows under a 25 px heading: a 280 px widget fits 8 of them
+        self.tree.row_box = (0, 25, 200, 30)
+        self.tree._on_configure(MagicMock(height=280))
+        self.assertEqual(len(self.rendered()), 8)
+        self.tree.yview("moveto", "1.0")
+        self.assertEqual(self.rendered()[-1], 99)
+
+    def test_visible_rows_fall_back_without_measurement(self):
+        self.tree.items.clear()
+        self.tree._on_configure(MagicMock(height=220))
+        self.assertEqual(len(self.rendered()), 10)
+
+if __name__ == '__main__':
+    unittest.main()
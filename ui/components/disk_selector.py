@@ -9,6 +9,7 @@ class DiskSelector(ttk.LabelFrame):
         self.show_all_var = show_all_var
         self.refresh_command = refresh_command
         self.selected_disk = tk.StringVar()
+        self.drives = {} # disk id -> drive dict from the last scan
 
         self.create_widgets()
 
@@ -57,6 +58,7 @@ class DiskSelector(ttk.LabelFrame):
     def _update_ui(self, drives):
         try:
             self.disk_combo.config(state="readonly")
+            self.drives = {d['id']: d for d in drives}
             options = []
             if drives:
                 for d in drives:
@@ -70,14 +72,13 @@ class DiskSelector(ttk.LabelFrame):
                     options.append(f"{d['name']} ({d['id']}) - {d['size_gb']:.1f} GB {details}")
                 self.disk_combo['values'] = options
                 if options: self.disk_combo.current(0)
-                self.on_select(None)
             else:
                 self.disk_combo['values'] = ["No external USB drives found"]
                 self.disk_combo.set("No external USB drives found")
-                # Ensure we trigger on_select to clear dependent UI if needed
-                self.on_select(None)
         except Exception as e:
             print(f"Error updating UI: {e}")
+        # Always re-sync dependent UI with whatever the combobox now shows
+        self.on_select(None)
 
     def get_selected_id(self):
         val = self.selected_disk.get()
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import ttk
 
 class StatusPanel(ttk.LabelFrame):
+    # Cap on lines kept in the log widget so long runs don't grow it unbounded
+    MAX_LOG_LINES = 10000
+
     def __init__(self, parent):
         super().__init__(parent, text="Progress & Status")
         self.create_widgets()
@@ -39,13 +42,24 @@ class StatusPanel(ttk.LabelFrame):
         self.log_text.pack(fill="both", expand=True)
 
     def log(self, message):
+        self.log_batch([message])
+
+    def log_batch(self, messages):
+        """Append several messages with a single insert/see round-trip."""
+        if not messages: return
+        lines = [str(m) for m in messages]
         self.log_text.config(state="normal")
-        self.log_text.insert("end", str(message) + "\n")
+        self.log_text.insert("end", "\n".join(lines) + "\n")
+        # Drop the oldest lines so reflow cost stays bounded on long runs
+        line_count = int(self.log_text.index("end-1c").split('.')[0])
+        if line_count > self.MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{line_count - self.MAX_LOG_LINES}.0")
         self.log_text.see("end")
         self.log_text.config(state="disabled")
-        # Also update status label if short
-        if len(str(message)) < 50:
-            self.status_label.config(text=str(message))
+        # Status label shows the most recent short message
+        last = lines[-1]
+        if len(last) < 50:
+            self.status_label.config(text=last)
 
     def set_phase(self, phase_name):
         for name, lbl in self.phase_labels.items():
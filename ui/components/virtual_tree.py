@@ -0,0 +1,104 @@
+import tkinter as tk
+from tkinter import ttk
+
+ROW_HEIGHT = 20 # Fallback row height in pixels when it can't be measured
+
+class VirtualTree(ttk.Treeview):
+    """
+    Treeview that only materializes the rows currently in view.
+
+    The full data lives in `self._model` (list of value tuples); scrolling
+    re-renders the visible window instead of the widget holding every row.
+    Rendered item ids are the model indices as strings.
+    """
+
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._model = []
+        self._tags = []
+        self._top = 0
+        self._rows = int(kwargs.get("height", 10))
+        self._height = 0 # Last configured widget height in pixels
+        self._scrollbar = None
+        self.bind("<Configure>", self._on_configure)
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda e: self._scroll_to(self._top - 3))
+        self.bind("<Button-5>", lambda e: self._scroll_to(self._top + 3))
+
+    def attach_scrollbar(self, scrollbar):
+        self._scrollbar = scrollbar
+        scrollbar.configure(command=self.yview)
+
+    def set_model(self, rows, tags=None):
+        self._model = list(rows)
+        self._tags = list(tags) if tags else [()] * len(self._model)
+        self._top = 0
+        self._render()
+
+    def set_row_value(self, index, col, value):
+        """Update one cell in the model, and on screen if the row is rendered."""
+        row = list(self._model[index])
+        row[col] = value
+        self._model[index] = tuple(row)
+        iid = str(index)
+        if self.exists(iid):
+            self.item(iid, values=self._model[index])
+
+    def yview(self, *args):
+        if not args: return self._fractions()
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._model)))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages": step *= self._rows
+            self._scroll_to(self._top + step)
+
+    def _fractions(self):
+        n = len(self._model)
+        if not n: return (0.0, 1.0)
+        return (self._top / n, min(1.0, (self._top + self._rows) / n))
+
+    def _on_configure(self, event):
+        self._height = event.height
+        # Measure once geometry has settled and the rows are on screen
+        self.after_idle(self._fit_rows)
+
+    def _row_metrics(self):
+        """Return (y of the first row, row height) as drawn by the theme."""
+        children = self.get_children()
+        box = self.bbox(children[0]) if children else None
+        if box:
+            return box[1], box[3]
+        try:
+            height = int(ttk.Style(self).lookup("Treeview", "rowheight")) or ROW_HEIGHT
+        except (ValueError, tk.TclError):
+            height = ROW_HEIGHT
+        return height, height # assume the heading is about one row tall
+
+    def _fit_rows(self):
+        offset, height = self._row_metrics()
+        rows = max(1, (self._height - offset) // height)
+        if rows != self._rows:
+            self._rows = rows
+            self._scroll_to(self._top, force=True)
+
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas; only the sign matters
+        self._scroll_to(self._top + (-3 if event.delta > 0 else 3))
+        return "break"
+
+    def _scroll_to(self, top, force=False):
+        top = max(0, min(top, len(self._model) - self._rows))
+        if top == self._top and not force: return
+        self._top = top
+        self._render()
+
+    def _render(self):
+        # Only the visible window ever lives in the widget
+        children = self.get_children()
+        if children: self.delete(*children)
+        end = min(len(self._model), self._top + self._rows)
+        for i in range(self._top, end):
+            self.insert("", "end", iid=str(i), values=self._model[i], tags=self._tags[i])
+        if self._scrollbar:
+            self._scrollbar.set(*self._fractions())
@@ -1,3 +1,4 @@
+import bisect
 import tkinter as tk
 from tkinter import ttk
 
@@ -6,26 +7,71 @@ class VisualizationCanvas(tk.Canvas):
         super().__init__(parent, height=height, bg="#ecf0f1")
         self.bind("<Button-1>", self.on_click)
         self.bind("<Motion>", self.on_hover)
+        self.bind("<Configure>", self.on_resize)
         self.on_click_command = on_click_command
         self.viz_segments = []
+        self._seg_edges = [] # Right x-edge of each drawn segment, for hit-testing
+        self._last_capacity_mb = 0
+        self._last_signature = None
+        self._resize_after_id = None
+        # Size recorded from <Configure> so drawing never forces a geometry flush
+        self._viz_w = 0
+        self._viz_h = 0
+
+    def on_resize(self, event):
+        self._viz_w = event.width
+        self._viz_h = event.height
+        # Coalesce resize bursts into a single redraw
+        if self._resize_after_id:
+            self.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.after(60, self._redraw_after_resize)
+
+    def _redraw_after_resize(self):
+        self._resize_after_id = None
+        self.draw_segments(self.viz_segments, self._last_capacity_mb)
 
     def draw_segments(self, segments, total_capacity_mb):
-        self.delete("all")
+        # Keep the latest list for hit-testing even when nothing needs redrawing
         self.viz_segments = segments
+        self._last_capacity_mb = total_capacity_mb
 
-        if total_capacity_mb <= 0: return
-        w = self.winfo_width()
-        h = self.winfo_height()
+        w = self._viz_w
+        h = self._viz_h
         if w < 10: w = 900
         if h < 10: h = int(self.cget("height"))
 
-        current_x = 0
+        signature = (
+            total_capacity_mb, w, h,
+            tuple((seg['name'], seg['size'], seg['color'], seg.get('outline'), seg.get('is_future_data'))
+                  for seg in segments)
+        )
+        if signature == self._last_signature: return
+        self._last_signature = signature
+
+        self.delete("all")
+        if total_capacity_mb <= 0:
+            self._seg_edges = []
+            return
+
         total_seg_size = sum(s['size'] for s in segments)
         render_max = max(total_capacity_mb, total_seg_size)
         scale = w / render_max if render_max > 0 else 1
 
+        # Lay out every segment in Python first, then issue the canvas calls
+        edges = []
+        current_x = 0
+        for seg in segments:
+            current_x += seg["size"] * scale
+            edges.append(current_x)
+        self._seg_edges = edges
+
+        current_x = 0
         for i, seg in enumerate(segments):
-            width = seg["size"] * scale
+            width = edges[i] - current_x
+            if width < 1:
+                # Not visible at this scale; skip the Tcl round-trips
+                current_x = edges[i]
+                continue
             outline = seg.get("outline", "white")
             tag_id = f"seg_{i}"
 
@@ -47,33 +93,29 @@ class VisualizationCanvas(tk.Canvas):
                     tags=(tag_id, "segment")
                 )
 
-            current_x += width
+            current_x = edges[i]
+
+    def segment_at(self, x):
+        """Index of the segment under canvas x-coordinate x, or None."""
+        if x < 0: return None
+        idx = bisect.bisect_right(self._seg_edges, x)
+        if 0 <= idx < len(self.viz_segments):
+            return idx
+        return None
 
     def on_click(self, event):
         if self.on_click_command:
             self.on_click_command(event)
 
     def on_hover(self, event):
-        x = self.canvasx(event.x)
-        y = self.canvasy(event.y)
-        item = self.find_closest(x, y)
-        tags = self.gettags(item)
-
-        # Simple tooltip logic: Create a temp label or use existing Tooltip class if adapted
-        # Since standard Tooltip class is widget-based, we might need a canvas-specific one.
-        # For now, let's just print to console for verification or use a simple floating label if feasible.
-        # Actually, let's use the provided `ui.components.tooltip` but we need to bind it to the *canvas* and update text.
-
-        for tag in tags:
-            if tag.startswith("seg_"):
-                idx = int(tag.split("_")[1])
-                if 0 <= idx < len(self.viz_segments):
-                    seg = self.viz_segments[idx]
-                    text = f"{seg['name']}\nSize: {seg['size']:.1f} MB"
-                    # We can't easily use the widget tooltip class for specific items.
-                    # Implementing a simple canvas tooltip here.
-                    self.show_canvas_tooltip(event.x_root, event.y_root, text)
-                return
+        idx = self.segment_at(event.x)
+        if idx is not None:
+            seg = self.viz_segments[idx]
+            text = f"{seg['name']}\nSize: {seg['size']:.1f} MB"
+            # We can't easily use the widget tooltip class for specific items.
+            # Implementing a simple canvas tooltip here.
+            self.show_canvas_tooltip(event.x_root, event.y_root, text)
+            return
 
         self.hide_canvas_tooltip()
 
@@ -6,6 +6,7 @@ ONE RESPONSIBILITY: Provide a graphical interface for the tool
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, simpledialog
 import threading
+import concurrent.futures
 import sys
 import os
 import queue
@@ -13,12 +14,17 @@ import subprocess
 import time
 import json
 import math
+import re
+import functools
+import collections
+import traceback
 
 # Import core modules
-from detection import installer_scanner, disk_detector
+from detection import installer_scanner, disk_detector, stub_validator
 from core import privilege, constants, config_manager
 from operations import partitioner, installer_runner, branding, updater
 from integration import mist_downloader
+from safety import backup_manager
 
 # Import modular components
 from ui.components.disk_selector import DiskSelector
@@ -26,6 +32,47 @@ from ui.components.installer_tree import InstallerTree
 from ui.components.status_panel import StatusPanel
 from ui.components.action_panel import ActionPanel
 from ui.components.visualization_canvas import VisualizationCanvas
+from ui.components.virtual_tree import VirtualTree
+
+# Parses "Name (disk4) - 64.0 GB [USB]" entries from the disk combobox
+DISK_SELECTION_RE = re.compile(r'\((disk\d+)\)\s*-\s*([\d.]+)\s*GB')
+
+# How long Mist search results stay fresh (seconds)
+MIST_CACHE_TTL = 600
+
+# How long a scanned drive layout is reused before asking diskutil again (seconds)
+STRUCTURE_CACHE_TTL = 10
+
+# Index of the "Buffer" column in installer tree values
+BUFFER_COL = 5
+
+# Treeview tag marking checked installer rows; the "Select" column mirrors it
+SELECTED_TAG = "selected"
+
+# OS codenames, longest first so "high sierra" wins over "sierra"
+OS_CODENAMES = sorted((info['name'].lower() for info in constants.OS_DATABASE.values()), key=len, reverse=True)
+
+# Installer app decorations stripped to get the bare OS name
+_CLEAN_RE = re.compile(r'^(?:Install macOS |Install )|\.app$')
+
+# Marketing prefixes dropped when retrying a Mist download by bare name
+_INSTALLER_PREFIX_RE = re.compile(r'^(?:OS X |macOS |Mac )+')
+
+@functools.lru_cache(maxsize=256)
+def _clean(name):
+    """'Install macOS Sonoma.app' -> 'Sonoma'. Names repeat on every redraw."""
+    return _CLEAN_RE.sub('', name)
+
+@functools.lru_cache(maxsize=256)
+def _match_tokens(clean_name):
+    """Normalized keys used to pair installers with existing partitions."""
+    norm = clean_name.replace("_", " ").lower().strip()
+    tokens = {norm}
+    for codename in OS_CODENAMES:
+        if codename in norm:
+            tokens.add(codename)
+            break
+    return frozenset(tokens)
 
 class MultiBootGUI:
     def __init__(self, root, config=None):
@@ -41,15 +88,35 @@ class MultiBootGUI:
 
         # Variables
         self.installers_list = []
+        self._installer_index = {} # (name, version) -> installer dict
+        self._installer_by_token = {} # normalized OS name token -> newest installer
         self.log_queue = queue.Queue()
         self.is_working = False
 
+        # Log poller backoff state (ms); reset to fast polling on new messages
+        self._poll_delay = 50
+
+        # Install progress lines from worker threads, flushed on a slower timer
+        self._log_q = collections.deque()
+        self._log_pump_scheduled = False
+
+        # Pending debounced buffer-slider update
+        self._buf_after_id = None
+
         # State
         self.current_disk_size_gb = 0.0
         self.total_required_gb = 0.0
         self.custom_buffers = {}
         self.existing_installers_map = {} # Store existing content
         self.drive_structure = None # Detailed structure
+        self._selected_disk_id = None # Parsed once per disk selection
+        self._selected_disk_total_gb = 0.0
+        self._mist_cache = {} # search term -> (timestamp, installers)
+        self._structure_cache = {} # disk_id -> (timestamp, drive structure)
+        self._content_rows = {} # part_id -> values shown in content_tree
+        self._content_item_by_partid = {} # part_id -> content_tree item id
+        self._inst_row_tags = {} # inst_tree item id -> tags it was inserted with
+        self._stub_item_ids = set() # inst_tree item ids of stub installers
 
         # UI State
         self.show_all_disks_var = tk.BooleanVar(value=False)
@@ -75,8 +142,8 @@ class MultiBootGUI:
         # Start log poller
         self.poll_log_queue()
 
-        # Initial scan
-        self.refresh_hardware()
+        # Initial scan, deferred so the window paints before any scan work starts
+        self.root.after(50, self.refresh_hardware)
 
     def set_mode(self, mode):
         self.mode_var.set(mode)
@@ -147,23 +214,10 @@ class MultiBootGUI:
         self.mode_rb_update.pack(side="left", padx=5)
 
         # Existing Content Panel (Visible in Update Mode)
-        self.content_frame = ttk.LabelFrame(top_frame, text="Existing Drive Content")
-        # Initially hidden, packed in on_mode_change if update
-
-        cols = ("Partition", "Size", "Latest Version", "Action")
-        self.content_tree = ttk.Treeview(self.content_frame, columns=cols, show="headings", height=5)
-        for col in cols:
-            self.content_tree.heading(col, text=col)
-            self.content_tree.column(col, width=100)
-        self.content_tree.column("Partition", width=200)
-        self.content_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
-
-        # Content Actions
-        cbtn_frame = ttk.Frame(self.content_frame)
-        cbtn_frame.pack(side="right", fill="y", padx=5, pady=5)
-        ttk.Button(cbtn_frame, text="Delete Partition", command=self.delete_existing_partition).pack(fill="x", pady=2)
-        ttk.Button(cbtn_frame, text="Check Updates", command=self.check_for_updates).pack(fill="x", pady=2)
-        ttk.Button(cbtn_frame, text="Scan Content", command=lambda: self.on_disk_selected(None)).pack(fill="x", pady=2)
+        # Built on first entry into update mode by _ensure_content_frame
+        self._top_frame = top_frame
+        self._content_built = False
+        self.context_menu = None
 
         # Middle: Installer Selection
         self.installer_tree_frame = InstallerTree(
@@ -236,6 +290,37 @@ class MultiBootGUI:
         self.status_panel = StatusPanel(bottom_frame)
         self.status_panel.pack(fill="both", expand=True, padx=5, pady=5)
 
+    def _ensure_content_frame(self):
+        """Create the existing-content panel the first time update mode is shown."""
+        if self._content_built: return
+        self._content_built = True
+
+        self.content_frame = ttk.LabelFrame(self._top_frame, text="Existing Drive Content")
+
+        cols = ("Partition", "Size", "Latest Version", "Action")
+        self.content_tree = ttk.Treeview(self.content_frame, columns=cols, show="headings", height=5)
+        for col in cols:
+            self.content_tree.heading(col, text=col)
+            self.content_tree.column(col, width=100)
+        self.content_tree.column("Partition", width=200)
+        self.content_tree.pack(side="left", fill="both", expand=True, padx=5, pady=5)
+
+        # Content Actions
+        cbtn_frame = ttk.Frame(self.content_frame)
+        cbtn_frame.pack(side="right", fill="y", padx=5, pady=5)
+        ttk.Button(cbtn_frame, text="Delete Partition", command=self.delete_existing_partition).pack(fill="x", pady=2)
+        ttk.Button(cbtn_frame, text="Check Updates", command=self.check_for_updates).pack(fill="x", pady=2)
+        ttk.Button(cbtn_frame, text="Scan Content", command=self.rescan_drive_content).pack(fill="x", pady=2)
+
+    def _ensure_context_menu(self):
+        """Create the installer context menu on first right-click."""
+        if self.context_menu is not None: return
+        self.context_menu = tk.Menu(self.root, tearoff=0)
+        self.context_menu.add_command(label="Toggle Selection", command=lambda: self.on_space_press(None))
+        self.context_menu.add_command(label="Edit Buffer...", command=self.edit_selected_buffer)
+        self.context_menu.add_separator()
+        self.context_menu.add_command(label="Delete Local", command=self.delete_selected_installer)
+
     # --- Event Handlers ---
 
     def check_for_updates(self):
@@ -252,50 +337,63 @@ class MultiBootGUI:
                 return
 
             existing = self.drive_structure.get('existing_partitions', [])
-            updates_found = 0
 
+            # One Mist query per distinct name, skipping names queried recently
+            results = {}
+            to_fetch = []
+            now = time.monotonic()
+            for name in {part['clean_name'] for part in existing}: # e.g. "High Sierra"
+                cached = self._mist_cache.get(name)
+                if cached and now - cached[0] < MIST_CACHE_TTL:
+                    results[name] = cached[1]
+                else:
+                    to_fetch.append(name)
+
+            if to_fetch:
+                # Each query spawns `mist list`, so run them side by side
+                with concurrent.futures.ThreadPoolExecutor(max_workers=min(4, len(to_fetch))) as executor:
+                    futures = {executor.submit(mist_downloader.list_installers, name): name for name in to_fetch}
+                    for future in concurrent.futures.as_completed(futures):
+                        name = futures[future]
+                        installers = future.result()
+                        # [] also means mist failed; let the next check retry
+                        if installers:
+                            self._mist_cache[name] = (time.monotonic(), installers)
+                        results[name] = installers
+
+            latest_by_part = {}
             for part in existing:
-                name = part['clean_name'] # e.g. "High Sierra"
-                # Search Mist for this name
-                # mist list installer "High Sierra" --output-type json
-                # This returns list. We want the latest.
-
-                # Check cache or fetch
-                installers = mist_downloader.list_installers(name)
+                installers = results.get(part['clean_name'])
                 if installers:
-                    # Find latest compatible? Or just latest.
                     # list_installers already marks 'latest'.
                     latest_ver = "Unknown"
                     for inst in installers:
                          if inst.get('latest'):
                              latest_ver = f"{inst['version']} ({inst['build']})"
                              break
+                    latest_by_part[part['id']] = latest_ver
 
-                    # Update Treeview safely
-                    def update_tree(p_id, l_ver):
-                        for item in self.content_tree.get_children():
-                             item_tags = self.content_tree.item(item, "tags")
-                             if p_id in item_tags:
-                                 # Update value
-                                 curr_vals = self.content_tree.item(item)['values']
-                                 # (Name, Size, Latest, Action)
-                                 self.content_tree.item(item, values=(curr_vals[0], curr_vals[1], l_ver, curr_vals[3]))
-
-                    self.root.after(0, update_tree, part['id'], latest_ver)
-                    updates_found += 1
-
-            self.log(f"Update check complete. Checked {updates_found} partitions.")
+            # Update Treeview safely
+            self.root.after(0, self._apply_latest_versions, latest_by_part)
+            self.log(f"Update check complete. Checked {len(latest_by_part)} partitions.")
 
         except Exception as e:
             self.log(f"Update check failed: {e}")
 
+    def _apply_latest_versions(self, latest_by_part):
+        for p_id, l_ver in latest_by_part.items():
+            item = self._content_item_by_partid.get(p_id)
+            if item is None: continue
+            # (Name, Size, Latest, Action)
+            curr_vals = self.content_tree.item(item, 'values')
+            self.content_tree.item(item, values=(curr_vals[0], curr_vals[1], l_ver, curr_vals[3]))
+
     def optimize_buffers(self):
         if not messagebox.askyesno("Optimize Density", "Apply version-aware minimum buffers?\n\nThis will reduce overhead to fit more installers, but leaves less room for OS updates/caching.\n\n• macOS 14+: 0.8 GB\n• macOS 12-13: 0.5 GB\n• Older: 0.3 GB"):
             return
 
         updates_made = 0
-        for item in self.inst_tree.get_children():
-            values = self.inst_tree.item(item)['values']
+        for item, values in self._iter_all_rows():
             name = values[1]
             ver = str(values[2])
 
@@ -312,7 +410,10 @@ class MultiBootGUI:
 
             key = f"{name}_{ver}"
             self.custom_buffers[key] = smart_buffer
-            self.inst_tree.set(item, "Buffer", f"{smart_buffer:.1f} GB")
+            # Write the row back in one call instead of a read+write set()
+            new_values = list(values)
+            new_values[BUFFER_COL] = f"{smart_buffer:.1f} GB"
+            self.inst_tree.item(item, values=new_values)
             updates_made += 1
 
         self.update_space_usage()
@@ -320,14 +421,19 @@ class MultiBootGUI:
 
     def on_mode_change(self):
         mode = self.mode_var.get()
+        if self.config.get("last_mode") != mode:
+            self.config["last_mode"] = mode
+            config_manager.save_config_debounced(self.config)
         if mode == "update":
             self.create_btn.config(text="UPDATE EXISTING USB")
+            self._ensure_content_frame()
             # Pack after the disk_selector frame
             self.content_frame.pack(fill="both", expand=True, padx=5, pady=5, after=self.disk_selector)
             self.on_disk_selected(None)
         else:
             self.create_btn.config(text="CREATE BOOTABLE USB (Erase All)")
-            self.content_frame.pack_forget()
+            if self._content_built:
+                self.content_frame.pack_forget()
         self.update_space_usage()
 
     def on_tree_click(self, event):
@@ -359,11 +465,7 @@ class MultiBootGUI:
         if "stub" in tags:
             return # Silent fail for spacebar bulk toggle
 
-        current = self.inst_tree.set(item_id, "Select")
-        is_checked = current in ["☑", "[x]", "YES", "✓"]
-        new_val = "[ ]" if is_checked else "[x]"
-
-        self.inst_tree.set(item_id, "Select", new_val)
+        self._set_checked(item_id, SELECTED_TAG not in tags, tags)
 
         # Defer space calculation to prevent blocking the UI thread during rapid clicks
         if hasattr(self, '_update_space_timer'):
@@ -392,67 +494,162 @@ class MultiBootGUI:
             self.update_space_usage()
 
     def log(self, message):
+        # Safe from any thread: no Tk calls here, the poller picks it up
         self.log_queue.put(message)
 
     def poll_log_queue(self):
+        # Drain everything pending and hand it to the widget in one batch
+        msgs = []
         try:
             while True:
-                msg = self.log_queue.get_nowait()
-                self.status_panel.log(msg)
+                msgs.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
-        self.root.after(100, self.poll_log_queue)
+        if msgs and self._log_q:
+            # Progress lines were queued first; keep them ahead of later messages
+            msgs = self._drain_progress(len(self._log_q)) + msgs
+        if msgs:
+            self.status_panel.log_batch(msgs)
+        # Poll fast while messages are flowing, back off exponentially when idle;
+        # keep the ceiling low during a run so worker output shows up promptly
+        max_delay = 100 if self.is_working else 500
+        self._poll_delay = 20 if msgs else min(max_delay, self._poll_delay * 2)
+        self.root.after(self._poll_delay, self.poll_log_queue)
+
+    def log_progress(self, message):
+        """Queue a progress line from a worker; shown by the next _pump_log."""
+        self._log_q.append(message)
+
+    def _progress_callback(self, name):
+        """
+        Build a createinstallmedia progress callback for one installer.
+
+        The runner only reports changed values, but they can skip numbers,
+        so log whenever a new 10% step is reached rather than on exact
+        multiples of 10.
+        """
+        last_step = -1
+        def cb(p):
+            nonlocal last_step
+            if p // 10 != last_step:
+                last_step = p // 10
+                self.log_progress(f"  {name}: {p}%")
+        return cb
+
+    def _drain_progress(self, limit):
+        batch = []
+        while self._log_q and len(batch) < limit:
+            batch.append(self._log_q.popleft())
+        return batch
+
+    def _schedule_log_pump(self):
+        if self._log_pump_scheduled: return
+        self._log_pump_scheduled = True
+        self.root.after(200, self._pump_log)
+
+    def _pump_log(self):
+        self._log_pump_scheduled = False
+        batch = self._drain_progress(50)
+        if batch:
+            self.status_panel.log_batch(batch)
+        # Keep pumping while a job can still produce progress
+        if self._log_q or self.is_working:
+            self._schedule_log_pump()
 
     def on_buffer_change(self, value):
         val = float(value)
         self.buffer_label.configure(text=f"{val:.1f} GB")
-        for item in self.inst_tree.get_children():
-            values = self.inst_tree.item(item)['values']
+        # The Scale fires for every pixel dragged; only apply the final value
+        if self._buf_after_id:
+            self.root.after_cancel(self._buf_after_id)
+        self._buf_after_id = self.root.after(60, self._apply_buffer_change, val)
+
+    def _apply_buffer_change(self, val):
+        self._buf_after_id = None
+        self.config["default_buffer"] = val
+        config_manager.save_config_debounced(self.config)
+        buf_text = f"{val:.1f} GB"
+        for item, values in self._iter_all_rows():
             name_ver_key = f"{values[1]}_{values[2]}"
-            if name_ver_key not in self.custom_buffers:
-                self.inst_tree.set(item, "Buffer", f"{val:.1f} GB")
+            if name_ver_key not in self.custom_buffers and values[BUFFER_COL] != buf_text:
+                new_values = list(values)
+                new_values[BUFFER_COL] = buf_text
+                self.inst_tree.item(item, values=new_values)
         self.update_space_usage()
 
-    def on_disk_selected(self, event):
+    def rescan_drive_content(self):
+        """Re-read the selected drive's layout, bypassing the structure cache."""
+        self.on_disk_selected(None, force=True)
+
+    def _clear_selected_disk(self):
+        """Forget the parsed selection so nothing acts on a disk that may be gone."""
+        self._selected_disk_id = None
+        self._selected_disk_total_gb = 0.0
+
+    def on_disk_selected(self, event, force=False):
         disk_str = self.selected_disk.get()
+        self._clear_selected_disk()
         if not disk_str or "No external" in disk_str: return
-        try:
-            disk_id = disk_str.split('(')[1].split(')')[0]
-            threading.Thread(target=self.scan_drive_content, args=(disk_id,)).start()
-        except: pass
+        match = DISK_SELECTION_RE.search(disk_str)
+        if match:
+            self._selected_disk_id = match.group(1)
+            # Prefer the exact size from the selector's last diskutil scan over the rounded label
+            drive = self.disk_selector.drives.get(self._selected_disk_id)
+            if drive:
+                self._selected_disk_total_gb = drive['size_gb']
+            else:
+                try:
+                    self._selected_disk_total_gb = float(match.group(2))
+                except ValueError:
+                    pass
+            threading.Thread(target=self.scan_drive_content, args=(self._selected_disk_id, force)).start()
         self.update_space_usage()
 
-    def scan_drive_content(self, disk_id):
-        self.log(f"Scanning content of {disk_id}...")
-        structure = updater.get_drive_structure(disk_id)
+    def scan_drive_content(self, disk_id, force=False):
+        cached = self._structure_cache.get(disk_id)
+        if not force and cached and time.monotonic() - cached[0] < STRUCTURE_CACHE_TTL:
+            structure = cached[1]
+        else:
+            self.log(f"Scanning content of {disk_id}...")
+            structure = updater.get_drive_structure(disk_id)
+            if structure:
+                self._structure_cache[disk_id] = (time.monotonic(), structure)
+            else:
+                self._structure_cache.pop(disk_id, None)
         if structure:
             self.existing_installers_map = structure.get('existing_installers', {})
             self.drive_structure = structure # Store full structure
 
             # Auto-Detect Mode
             existing = structure.get('existing_partitions', [])
-            if existing:
-                self.mode_var.set("update")
-            else:
-                self.mode_var.set("create")
+            new_mode = "update" if existing else "create"
+            mode_changed = new_mode != self.mode_var.get()
+            self.mode_var.set(new_mode)
 
-            self.root.after(0, self.on_mode_change)
-            self.root.after(0, lambda: self.update_content_ui(structure))
-            self.root.after(0, self.update_space_usage)
+            self.root.after(0, self._apply_drive_structure, structure, mode_changed)
             self.log(f"Found {len(existing)} existing partitions.")
         else:
             self.log(f"Failed to read structure for {disk_id}.")
             self.drive_structure = None
             self.existing_installers_map = {}
-            self.root.after(0, lambda: self.update_content_ui({'existing_partitions': []}))
-            self.root.after(0, self.update_space_usage)
+            self.root.after(0, self._apply_drive_structure, {'existing_partitions': []}, False)
+
+    def _apply_drive_structure(self, structure, mode_changed):
+        """Apply a finished drive scan to the UI in one main-loop callback."""
+        # on_mode_change rescans the disk in update mode, so only call it
+        # when the detected mode actually differs to avoid a rescan loop.
+        if mode_changed:
+            self.on_mode_change()
+        self.update_content_ui(structure)
+        self.update_space_usage()
 
     def update_content_ui(self, structure):
-        for item in self.content_tree.get_children():
-            self.content_tree.delete(item)
-
+        # Nothing to sync until update mode has built the panel
+        if not self._content_built: return
         existing = structure.get('existing_partitions', [])
 
+        # Diff against what is already shown and only touch changed rows
+        rows = {}
         for part in existing:
             size_gb = part['size'] / 1e9
             name = part['clean_name'] # e.g. "Sonoma"
@@ -461,10 +658,9 @@ class MultiBootGUI:
             action = "Keep"
             matching_installer = None
 
-            for inst in self.installers_list:
-                # Simple name match
-                if name in inst['name']:
-                    matching_installer = inst
+            for token in _match_tokens(name):
+                matching_installer = self._installer_by_token.get(token)
+                if matching_installer:
                     break
 
             if matching_installer:
@@ -473,7 +669,20 @@ class MultiBootGUI:
             # Placeholder for latest version check (populated by check_for_updates)
             latest = "Check Mist"
 
-            self.content_tree.insert("", "end", values=(part['name'], f"{size_gb:.1f} GB", latest, action), tags=(part['id'],))
+            rows[part['id']] = (part['name'], f"{size_gb:.1f} GB", latest, action)
+
+        for part_id in list(self._content_rows):
+            if part_id not in rows:
+                self.content_tree.delete(self._content_item_by_partid.pop(part_id))
+                del self._content_rows[part_id]
+
+        for part_id, values in rows.items():
+            item = self._content_item_by_partid.get(part_id)
+            if item is None:
+                self._content_item_by_partid[part_id] = self.content_tree.insert("", "end", values=values, tags=(part_id,))
+            elif self._content_rows[part_id] != values:
+                self.content_tree.item(item, values=values)
+            self._content_rows[part_id] = values
 
     def delete_existing_partition(self):
         sel = self.content_tree.selection()
@@ -493,25 +702,54 @@ class MultiBootGUI:
             if updater.delete_partition(part_id):
                 self.log("Deleted. Rescanning...")
                 # Rescan logic
-                disk_str = self.selected_disk.get()
-                if disk_str:
-                    disk_id = disk_str.split('(')[1].split(')')[0]
-                    self.scan_drive_content(disk_id)
+                if self._selected_disk_id:
+                    self.scan_drive_content(self._selected_disk_id, force=True)
             else:
                 self.log("Delete failed.")
         except Exception as e:
             self.log(f"Error: {e}")
 
-    def get_selected_installers(self):
-        selected = []
+    def _iter_all_rows(self):
+        """Yield (item_id, values) for every installer row with one Tcl call per row."""
         for item in self.inst_tree.get_children():
-            val = self.inst_tree.set(item, "Select")
-            if val in ["☑", "[x]", "YES", "✓"]:
-                selected.append(item)
-        return selected
+            yield item, self.inst_tree.item(item, 'values')
+
+    def _installer_for_row(self, item_id, values):
+        """
+        Installer dict behind an inst_tree row.
+
+        Rows carry their installers_list index as a tag, which tells apart
+        several builds of one version; (name, version) is only a fallback.
+        """
+        tags = self._inst_row_tags.get(item_id) or self.inst_tree.item(item_id, "tags")
+        for tag in tags:
+            if tag.isdigit():
+                idx = int(tag)
+                if 0 <= idx < len(self.installers_list):
+                    return self.installers_list[idx]
+                break
+        return self._installer_index.get((values[1], str(values[2])))
+
+    def _selected_rows(self):
+        # Tk keeps its own index of tagged items; keep tree order for the plan
+        selected = set(self.inst_tree.tag_has(SELECTED_TAG))
+        if not selected: return []
+        return [(item, self.inst_tree.item(item, 'values'))
+                for item in self.inst_tree.get_children() if item in selected]
+
+    def _set_checked(self, item_id, checked, tags=None):
+        """Add or remove the selected tag and redraw the "Select" cell to match."""
+        if tags is None:
+            # Rows only ever gain or lose SELECTED_TAG, so the insert-time tags suffice
+            tags = self._inst_row_tags.get(item_id) or self.inst_tree.item(item_id, "tags")
+        tags = [t for t in tags if t != SELECTED_TAG]
+        if checked:
+            tags.append(SELECTED_TAG)
+        self.inst_tree.item(item_id, tags=tuple(tags))
+        self.inst_tree.set(item_id, "Select", "[x]" if checked else "[ ]")
 
     def update_space_usage(self, event=None):
-        selected_items = self.get_selected_installers()
+        selected_items = self._selected_rows()
         is_update = self.mode_var.get() == "update"
 
         total_download_kb = 0
@@ -547,53 +785,46 @@ class MultiBootGUI:
                     "clean_name": part['clean_name']
                 })
 
+        # Index existing segments by name token so each installer needs one lookup
+        existing_by_clean = {}
+        for idx, seg in enumerate(segments):
+            if seg.get('type') == 'existing':
+                for token in _match_tokens(seg['clean_name']):
+                    existing_by_clean.setdefault(token, []).append(idx)
+
         # 2. Add Selected Installers
-        for item_id in selected_items:
-            values = self.inst_tree.item(item_id)['values']
+        for item_id, values in selected_items:
             name = values[1]
             version = str(values[2])
 
-            # Use tags for quick lookup of size
-            size_kb = 0
-            tags = self.inst_tree.item(item_id, "tags")
-
-            # Extract index from tags (it should be the first digit-only tag)
-            for tag in tags:
-                if tag.isdigit():
-                    idx = int(tag)
-                    if 0 <= idx < len(self.installers_list):
-                        size_kb = self.installers_list[idx].get('size_kb', 0)
-                    break
-
-            if size_kb == 0:
-                for inst in self.installers_list:
-                    if inst['name'] == name and str(inst['version']) == version:
-                        size_kb = inst.get('size_kb', 0)
-                        break
+            inst = self._installer_for_row(item_id, values) or {}
+            size_kb = inst.get('size_kb', 0)
 
             # Check download requirement
-            # The icon in values[6] can be used, but we can also use tags to verify "remote"
-            if "remote" in tags or "☁️" in str(values[6]):
+            if inst.get('source') == 'remote' or "☁️" in str(values[6]):
                 total_download_kb += size_kb
 
-            clean_name = name.replace("Install macOS ", "").replace("Install ", "").replace(".app", "")
+            clean_name = _clean(name)
             is_replacing = False
             replace_target_size_mb = 0
             replaced_seg_index = -1
 
             # Check for existing partition to replace in our segments list
             if is_update:
-                for idx, seg in enumerate(segments):
-                    if seg.get('type') == 'existing':
-                        # Match name
-                        if clean_name in seg['clean_name'] or seg['clean_name'] in clean_name:
-                            is_replacing = True
-                            replace_target_size_mb = seg['size']
-                            replaced_seg_index = idx
-                            break
+                for token in _match_tokens(clean_name):
+                    # Skip partitions already claimed by another installer
+                    hit = next((idx for idx in existing_by_clean.get(token, ())
+                                if segments[idx]['type'] == 'existing'), None)
+                    if hit is not None:
+                        is_replacing = True
+                        replace_target_size_mb = segments[hit]['size']
+                        replaced_seg_index = hit
+                        break
 
             try: buffer_gb = float(values[5].split()[0])
             except: buffer_gb = 2.0
+            # Quantize so slider drags keep hitting the partition size cache
+            buffer_gb = round(buffer_gb, 1)
 
             installer_size_mb = (size_kb / 1024)
 
@@ -602,11 +833,13 @@ class MultiBootGUI:
                 part_size_mb = replace_target_size_mb
 
                 color = "#e67e22" # Orange
-                if installer_size_mb * 1.02 > replace_target_size_mb:
+                is_error = installer_size_mb * 1.02 > replace_target_size_mb
+                if is_error:
                     color = "#e74c3c" # Red (Error)
 
                 # Update the segment in place
                 segments[replaced_seg_index]['color'] = color
+                segments[replaced_seg_index]['is_error'] = is_error
                 segments[replaced_seg_index]['name'] = f"Replace: {name}"
                 segments[replaced_seg_index]['type'] = 'replacing'
                 segments[replaced_seg_index]['installer_item'] = item_id # Link to tree
@@ -627,24 +860,18 @@ class MultiBootGUI:
         self.total_required_gb = total_required_mb / 1024.0
 
         # Available Space Logic
-        disk_str = self.selected_disk.get()
         available_gb = 0.0
 
-        if disk_str and "No external" not in disk_str:
-            try:
-                disk_id = disk_str.split('(')[1].split(')')[0]
-                if is_update and self.drive_structure:
-                    # In update mode, available for NEW partitions is just Free Space + DATA_STORE size
-                    free_gb = self.drive_structure['free_space'] / 1e9
-                    data_part = self.drive_structure.get('data_partition')
-                    if data_part:
-                        free_gb += data_part['size'] / 1e9
-                    available_gb = free_gb
-                else:
-                    size_part = disk_str.split(' - ')[1]
-                    available_gb = float(size_part.split()[0])
-            except:
-                available_gb = 0.0
+        if self._selected_disk_id:
+            if is_update and self.drive_structure:
+                # In update mode, available for NEW partitions is just Free Space + DATA_STORE size
+                free_gb = self.drive_structure['free_space'] / 1e9
+                data_part = self.drive_structure.get('data_partition')
+                if data_part:
+                    free_gb += data_part['size'] / 1e9
+                available_gb = free_gb
+            else:
+                available_gb = self._selected_disk_total_gb
         self.current_disk_size_gb = available_gb
 
         # Draw Free Space Segment
@@ -683,12 +910,10 @@ class MultiBootGUI:
                         error_msg = "Free Space Insufficient for New Items!"
 
                     # 2. Replacements must fit in Existing Partitions
-                    # We check the segments we just built for red color
-                    for seg in segments:
-                        if seg['color'] == "#e74c3c": # Red
-                            can_proceed = False
-                            error_msg = f"'{seg['name']}' too large for existing partition!"
-                            break
+                    bad_seg = next((seg for seg in segments if seg.get('is_error')), None)
+                    if bad_seg:
+                        can_proceed = False
+                        error_msg = f"'{bad_seg['name']}' too large for existing partition!"
 
                     if can_proceed:
                         status_text = "✅ Update Possible"
@@ -729,39 +954,31 @@ class MultiBootGUI:
         self.viz_canvas.draw_segments(segments, available_gb * 1024 if is_update else available_gb * 1024)
 
     def on_viz_click(self, event):
-        x = self.viz_canvas.canvasx(event.x)
-        y = self.viz_canvas.canvasy(event.y)
-        item = self.viz_canvas.find_closest(x, y)
-        tags = self.viz_canvas.gettags(item)
-
-        # Access segments from the canvas component
-        segments = self.viz_canvas.viz_segments
-
-        for tag in tags:
-            if tag.startswith("seg_"):
-                idx = int(tag.split("_")[1])
-                if 0 <= idx < len(segments):
-                    seg = segments[idx]
-                    installer_item = seg.get('installer_item')
-                    if installer_item:
-                        self.inst_tree.selection_set(installer_item)
-                        self.inst_tree.see(installer_item)
-                        self.inst_tree.focus(installer_item)
-                        # Open buffer editor on click if it's a new item
-                        if seg.get('type') == 'new' or seg.get('type') == 'replacing':
-                             self.edit_selected_buffer(installer_item)
-                    elif seg.get('type') == 'existing':
-                        # Highlight in content tree
-                        part_id = seg.get('id')
-                        for child in self.content_tree.get_children():
-                            if part_id in self.content_tree.item(child, 'tags'):
-                                self.content_tree.selection_set(child)
-                                self.content_tree.see(child)
-                                self.content_tree.focus(child)
-                                break
+        # Hit-test against the segment edges recorded by the canvas
+        idx = self.viz_canvas.segment_at(event.x)
+        if idx is None: return
+        seg = self.viz_canvas.viz_segments[idx]
+        installer_item = seg.get('installer_item')
+        if installer_item:
+            self.inst_tree.selection_set(installer_item)
+            self.inst_tree.see(installer_item)
+            self.inst_tree.focus(installer_item)
+            # Open buffer editor on click if it's a new item
+            if seg.get('type') == 'new' or seg.get('type') == 'replacing':
+                 self.edit_selected_buffer(installer_item)
+        elif seg.get('type') == 'existing':
+            # Highlight in content tree
+            child = self._content_item_by_partid.get(seg.get('id'))
+            if child:
+                self.content_tree.selection_set(child)
+                self.content_tree.see(child)
+                self.content_tree.focus(child)
 
     def refresh_hardware(self):
         self.log("Scanning hardware...")
+        self._structure_cache.clear()
+        # The combobox shows a placeholder until the rescan repopulates it
+        self._clear_selected_disk()
         # Delegate to DiskSelector (Async)
         self.disk_selector.update_disks()
 
@@ -772,8 +989,7 @@ class MultiBootGUI:
     def scan_installers(self):
         self.log("Scanning for installers (Local + Remote)...")
         # Clear tree
-        for item in self.inst_tree.get_children():
-            self.inst_tree.delete(item)
+        self._clear_tree(self.inst_tree)
 
         # Run in thread
         threading.Thread(target=self._scan_installers_thread).start()
@@ -781,12 +997,13 @@ class MultiBootGUI:
     def _scan_installers_thread(self):
         # 1. Local Scan
         local_list = installer_scanner.scan_for_installers()
-        import detection.stub_validator
+
+        stubs = stub_validator.check_stubs([inst['path'] for inst in local_list])
 
         # Enhance local list
-        for inst in local_list:
+        for inst, is_stub in zip(local_list, stubs):
             inst['source'] = 'local'
-            inst['is_stub'] = detection.stub_validator.is_stub_installer(inst['path'])
+            inst['is_stub'] = is_stub
             inst['status'] = "STUB" if inst['is_stub'] else "Ready"
             inst['identifier'] = None # Local ones might not have identifiers easily
 
@@ -846,19 +1063,37 @@ class MultiBootGUI:
         except: pass
 
         self.installers_list = final_list
+        self._installer_index = {(inst['name'], str(inst['version'])): inst for inst in final_list}
+        self._installer_by_token = self._build_token_index(final_list)
         self.root.after(0, self.apply_filter)
         self.root.after(0, lambda: self.log(f"Found {len(final_list)} installers (Local+Remote)."))
 
+    @staticmethod
+    def _build_token_index(installers):
+        """Map OS name tokens to the first (newest) installer carrying them."""
+        index = {}
+        for inst in installers:
+            tokens = set(_match_tokens(_clean(inst['name'])))
+            tokens.add(constants.get_os_name(str(inst['version']), inst['name']).lower())
+            for token in tokens:
+                index.setdefault(token, inst)
+        return index
+
     def apply_filter(self):
         # Clear current view
-        for item in self.inst_tree.get_children():
-            self.inst_tree.delete(item)
+        self._clear_tree(self.inst_tree)
+        self._inst_row_tags = {}
+        self._stub_item_ids = set()
 
         filter_mode = self.filter_var.get()
         search_term = self.search_var.get().lower()
 
-        count = 0
-        for inst in self.installers_list:
+        # Read once: buffer_var.get() is a Tcl round-trip
+        default_buffer = self.buffer_var.get()
+
+        # Build every row first, then insert them in one tight loop
+        rows = []
+        for idx, inst in enumerate(self.installers_list):
             # 1. Filter by Mode
             if filter_mode == "local" and inst['source'] != 'local': continue
             if filter_mode == "remote" and inst['source'] != 'remote': continue
@@ -867,14 +1102,11 @@ class MultiBootGUI:
             name_ver = f"{inst['name']} {inst['version']}".lower()
             if search_term and search_term not in name_ver: continue
 
-            # Add to tree
-            size_gb = inst['size_kb'] / (1024 * 1024)
-            source_icon = "💻" if inst['source'] == 'local' else "☁️"
+            size_gb = inst['size_kb'] / 1048576.0
+            is_local = inst['source'] == 'local'
 
             # Determine buffer
-            default_buffer = self.buffer_var.get()
-            key = f"{inst['name']}_{inst['version']}"
-            buf = self.custom_buffers.get(key, default_buffer)
+            buf = self.custom_buffers.get(f"{inst['name']}_{inst['version']}", default_buffer)
 
             values = (
                 "[ ]",
@@ -883,30 +1115,22 @@ class MultiBootGUI:
                 inst.get('build', ''),
                 f"{size_gb:.2f} GB",
                 f"{buf:.1f} GB",
-                source_icon,
+                "💻" if is_local else "☁️",
                 inst['status']
             )
 
-            item_id = self.inst_tree.insert("", "end", values=values)
-
-            # Store full data ref
-            # We need to map item_id to index in self.installers_list or store data
-            # Simplest is to rely on values, but source is icon now.
-            # Let's store index in tags
-            self.inst_tree.item(item_id, tags=(str(self.installers_list.index(inst)),))
-
-            tags = [str(self.installers_list.index(inst))]
-
-            if inst.get('source') == 'local':
-                tags.append("local")
-            else:
-                tags.append("remote")
-
+            # Store full data ref: index into self.installers_list in tags
+            tags = (str(idx), "local" if is_local else "remote")
             if inst.get('is_stub'):
-                tags.append("stub")
+                tags += ("stub",)
+            rows.append((values, tags))
 
-            self.inst_tree.item(item_id, tags=tuple(tags))
-            count += 1
+        for values, tags in rows:
+            # Values and tags in one insert call instead of insert + two item() calls
+            item_id = self.inst_tree.insert("", "end", values=values, tags=tags)
+            self._inst_row_tags[item_id] = tags
+            if "stub" in tags:
+                self._stub_item_ids.add(item_id)
 
         # Configure Visual Styles
         self.inst_tree.tag_configure("local", font=("TkDefaultFont", 10, "bold"), foreground="black")
@@ -914,23 +1138,30 @@ class MultiBootGUI:
         self.inst_tree.tag_configure("stub", foreground="gray", font=("TkDefaultFont", 10, "italic"))
         self.update_space_usage()
 
+    @staticmethod
+    def _clear_tree(tree):
+        # One delete call for all rows rather than a Tcl round-trip per row
+        children = tree.get_children()
+        if children: tree.delete(*children)
+
     def select_all_installers(self):
+        selected = set(self.inst_tree.tag_has(SELECTED_TAG))
         for item in self.inst_tree.get_children():
-            tags = self.inst_tree.item(item, "tags")
             # Only select if not stub. Remote is fine.
-            if "stub" not in tags:
-                self.inst_tree.set(item, "Select", "[x]")
+            if item not in self._stub_item_ids and item not in selected:
+                self._set_checked(item, True)
         self.update_space_usage()
 
     def deselect_all_installers(self):
-        for item in self.inst_tree.get_children():
-            self.inst_tree.set(item, "Select", "[ ]")
+        for item in self.inst_tree.tag_has(SELECTED_TAG):
+            self._set_checked(item, False)
         self.update_space_usage()
 
     def show_context_menu(self, event):
         item = self.inst_tree.identify_row(event.y)
         if item:
             self.inst_tree.selection_set(item)
+            self._ensure_context_menu()
             self.context_menu.post(event.x_root, event.y_root)
 
     def delete_selected_installer(self):
@@ -940,11 +1171,8 @@ class MultiBootGUI:
         for item in selected:
             values = self.inst_tree.item(item)['values']
             name = values[1]
-            path = None
-            for inst in self.installers_list:
-                if inst['name'] == name:
-                    path = inst['path']
-                    break
+            inst = self._installer_for_row(item, values)
+            path = inst.get('path') if inst else None
             if path:
                 try:
                     subprocess.run(['sudo', 'rm', '-rf', path], check=True)
@@ -979,53 +1207,54 @@ class MultiBootGUI:
         top.title("Select Version to Download")
         top.geometry("800x500")
         cols = ("Select", "Name", "Version", "Build", "Size", "Date", "Status")
-        tree = ttk.Treeview(top, columns=cols, show="headings", selectmode="extended")
+        # Mist can list hundreds of builds; only the visible rows are materialized
+        tree_frame = ttk.Frame(top)
+        tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+        tree = VirtualTree(tree_frame, columns=cols, show="headings", selectmode="extended")
         tree.heading("Select", text="[x]")
         tree.column("Select", width=40, anchor="center")
         for c in cols[1:]:
             tree.heading(c, text=c)
             if c == "Name": tree.column(c, width=200)
             else: tree.column(c, width=90)
-        tree.pack(fill="both", expand=True, padx=10, pady=10)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        tree.attach_scrollbar(scrollbar)
+        checked = set() # Model indices ticked for download
         def on_dl_click(event):
             region = tree.identify("region", event.x, event.y)
             if region == "cell" and tree.identify_column(event.x) == "#1":
                 item = tree.identify_row(event.y)
-                curr = tree.set(item, "Select")
-                is_checked = curr in ["☑", "[x]"]
-                tree.set(item, "Select", "[ ]" if is_checked else "[x]")
+                if not item: return
+                idx = int(item)
+                if idx in checked: checked.discard(idx)
+                else: checked.add(idx)
+                tree.set_row_value(idx, 0, "[x]" if idx in checked else "[ ]")
                 # Allow default selection
                 pass
 
         tree.bind("<Button-1>", on_dl_click)
+        rows = []
+        row_tags = []
         for item in data:
             size_gb = f"{item.get('size', 0) / (1024**3):.1f} GB"
             status_flags = []
             if item.get('downloaded'): status_flags.append("Installed")
             if item.get('latest'): status_flags.append("Latest")
             status_str = ", ".join(status_flags)
-            item_id = tree.insert("", "end", values=(
+            rows.append((
                 "[ ]", item.get('name'), item.get('version'), item.get('build'), size_gb, item.get('date'), status_str
             ))
-            if item.get('latest'): tree.item(item_id, tags=("latest",))
-            if item.get('downloaded'): tree.item(item_id, tags=("installed",))
+            if item.get('downloaded'): row_tags.append(("installed",))
+            elif item.get('latest'): row_tags.append(("latest",))
+            else: row_tags.append(())
         tree.tag_configure("latest", font=("TkDefaultFont", 10, "bold"))
         tree.tag_configure("installed", foreground="gray")
+        tree.set_model(rows, row_tags)
         def do_download():
-            selected_items = []
-            for item in tree.get_children():
-                val = tree.set(item, "Select")
-                if val in ["☑", "[x]"]:
-                    vals = tree.item(item)['values']
-                    name = vals[1]
-                    version = str(vals[2])
-                    build = str(vals[3])
-                    identifier = None
-                    for d in data:
-                        if d.get('name') == name and d.get('version') == version and d.get('build') == build:
-                            identifier = d.get('identifier')
-                            break
-                    selected_items.append((identifier, name))
+            # Checked state lives in the model, so off-screen rows count too
+            selected_items = [(data[i].get('identifier'), data[i].get('name')) for i in sorted(checked)]
             if not selected_items: return
             top.destroy()
             threading.Thread(target=self.run_download_process, args=(selected_items,)).start()
@@ -1047,7 +1276,7 @@ class MultiBootGUI:
                     if mist_downloader.download_installer([name]):
                         success = True
                     else:
-                        simple_name = name.replace("OS X ", "").replace("macOS ", "").replace("Mac ", "")
+                        simple_name = _INSTALLER_PREFIX_RE.sub('', name)
                         self.log(f"Retrying with simplified name '{simple_name}'...")
                         if mist_downloader.download_installer([simple_name]):
                             success = True
@@ -1063,9 +1292,8 @@ class MultiBootGUI:
             self.root.after(0, lambda: self.create_btn.config(state="normal"))
 
     def format_disk_dialog(self):
-        disk_str = self.selected_disk.get()
-        if not disk_str: return
-        disk_id = disk_str.split('(')[1].split(')')[0]
+        disk_id = self._selected_disk_id
+        if not disk_id: return
         if messagebox.askyesno("Format", f"Erase {disk_id}?"):
              threading.Thread(target=self.run_format_disk, args=(disk_id,)).start()
 
@@ -1079,36 +1307,27 @@ class MultiBootGUI:
             self.log(f"Format failed: {e}")
 
     def start_creation(self):
-        selected_items = self.get_selected_installers()
+        selected_items = self._selected_rows()
         if not selected_items: return
 
-        disk_str = self.selected_disk.get()
-        if not disk_str: return
-        try: disk_id = disk_str.split('(')[1].split(')')[0]
-        except: return
+        disk_id = self._selected_disk_id
+        if not disk_id: return
 
         target_installers = []
         download_list = []
+        total_dl_kb = 0
 
-        for item_id in selected_items:
-            values = self.inst_tree.item(item_id)['values']
+        for item_id, values in selected_items:
             buffer_val = float(values[5].split()[0])
-            found = None
-
-            tags = self.inst_tree.item(item_id, "tags")
-            # Safely extract the index from tags
-            for tag in tags:
-                if tag.isdigit():
-                    idx = int(tag)
-                    if 0 <= idx < len(self.installers_list):
-                        found = self.installers_list[idx].copy()
-                        found['buffer_gb'] = buffer_val
-                    break
+            found = self._installer_for_row(item_id, values)
 
             if found:
+                found = found.copy()
+                found['buffer_gb'] = buffer_val
                 target_installers.append(found)
                 if found.get('source') == 'remote':
                     download_list.append(found)
+                    total_dl_kb += found['size_kb']
 
         if not target_installers:
             self.log("Error: Could not extract installer details from selection.")
@@ -1118,9 +1337,14 @@ class MultiBootGUI:
             messagebox.showwarning("Missing Installers", "You have selected remote installers but auto-download is disabled.")
             return
 
-        self.show_preflight_dialog(disk_id, target_installers, download_list)
+        # Download totals are fixed for this selection; format them once
+        plan = {
+            "total_dl_kb": total_dl_kb,
+            "total_dl_str": f"{total_dl_kb/(1024*1024):.1f} GB"
+        }
+        self.show_preflight_dialog(disk_id, target_installers, download_list, plan)
 
-    def show_preflight_dialog(self, disk_id, installers, download_list):
+    def show_preflight_dialog(self, disk_id, installers, download_list, plan=None):
         top = tk.Toplevel(self.root)
         top.title("Pre-Flight Summary")
         top.geometry("600x500")
@@ -1140,8 +1364,10 @@ class MultiBootGUI:
         summary.append("-" * 40)
 
         if download_list:
-            total_dl = sum(i['size_kb'] for i in download_list) / (1024*1024)
-            summary.append(f"📥 Download: {len(download_list)} installers ({total_dl:.1f} GB)")
+            if plan is None:
+                total_dl_kb = sum(i['size_kb'] for i in download_list)
+                plan = {"total_dl_kb": total_dl_kb, "total_dl_str": f"{total_dl_kb/(1024*1024):.1f} GB"}
+            summary.append(f"📥 Download: {len(download_list)} installers ({plan['total_dl_str']})")
             for dl in download_list:
                 summary.append(f"   • {dl['name']} {dl['version']}")
             summary.append("")
@@ -1171,6 +1397,7 @@ class MultiBootGUI:
     def run_full_process(self, disk_id, installers, download_list):
         self.root.after(0, lambda: self.create_btn.config(state="disabled"))
         self.is_working = True
+        self._schedule_log_pump()
 
         def process_thread():
             # 1. Download Phase
@@ -1257,13 +1484,8 @@ class MultiBootGUI:
 
     def run_update_thread(self, disk_id, installers):
         try:
-            import operations.updater
-            import operations.installer_runner
-            import operations.branding
-            import core.constants
-
             self.log(f"Analyzing {disk_id}...")
-            structure = operations.updater.get_drive_structure(disk_id)
+            structure = updater.get_drive_structure(disk_id)
             if not structure:
                 self.log("Failed to analyze drive.")
                 return
@@ -1272,7 +1494,7 @@ class MultiBootGUI:
             existing_map = structure.get('existing_installers', {})
 
             for inst in installers:
-                new_os_name = core.constants.get_os_name(inst['version'], inst['name'])
+                new_os_name = constants.get_os_name(inst['version'], inst['name'])
                 match_id = None
                 if new_os_name in existing_map:
                     match_id = existing_map[new_os_name]
@@ -1288,20 +1510,25 @@ class MultiBootGUI:
                     self.log(f"{new_os_name} not found. Will add to free space.")
                     actions.append({'type': 'add', 'installer': inst})
 
+            # Free space left after our additions; replacements reuse their partition
+            free_left = structure['free_space']
+
             for action in actions:
                 inst = action['installer']
                 if action['type'] == 'replace':
                     target = action['target']
-                    res = operations.updater.replace_existing_partition(target, inst)
+                    res = updater.replace_existing_partition(target, inst)
                     if res:
                         part_name = res['name']
                     else:
                         self.log(f"Failed to prepare partition for {inst['name']}")
                         continue
                 elif action['type'] == 'add':
-                    res_list = operations.updater.add_partition_to_free_space(disk_id, [inst])
+                    res_list = updater.add_partition_to_free_space(disk_id, [inst])
                     if res_list:
                         part_name = res_list[0]['name']
+                        # diskutil's "M" is decimal megabytes
+                        free_left -= res_list[0]['size_mb'] * 1_000_000
                     else:
                         self.log(f"Failed to add partition for {inst['name']}")
                         continue
@@ -1309,60 +1536,70 @@ class MultiBootGUI:
                 self.log(f"Installing {inst['name']} to {part_name}...")
                 subprocess.run(['diskutil', 'mount', part_name])
                 mount_point = f"/Volumes/{part_name}"
-                if not os.path.exists(mount_point): time.sleep(3)
+                installer_runner.wait_for_mount(mount_point)
 
                 if os.path.exists(mount_point):
-                    def cb(p):
-                        if p%10==0: self.log(f"  {inst['name']}: {p}%")
-                    if operations.installer_runner.run_createinstallmedia(inst['path'], mount_point, progress_callback=cb):
+                    cb = self._progress_callback(inst['name'])
+                    if installer_runner.run_createinstallmedia(inst['path'], mount_point, progress_callback=cb):
                         self.log("Success.")
                         std_name = f"/Volumes/Install {inst['name'].replace('.app','')}"
                         if not os.path.exists(std_name): std_name = mount_point
-                        os_name = core.constants.get_os_name(inst['version'], inst['name'])
-                        operations.branding.apply_full_branding(std_name, inst['name'], os_name, inst['version'])
+                        os_name = constants.get_os_name(inst['version'], inst['name'])
+                        branding.apply_full_branding(std_name, inst['name'], os_name, inst['version'])
                     else:
                         self.log("Installation failed.")
                 else:
                     self.log(f"Could not mount {part_name}")
 
-            if structure['free_space'] > 2e9:
-                structure_new = operations.updater.get_drive_structure(disk_id)
+            # The tally ignores alignment and metadata, so only skip the rescan
+            # when it is well under the 2 GB restore threshold
+            if free_left > 1e9:
+                structure_new = updater.get_drive_structure(disk_id)
                 if structure_new and structure_new['free_space'] > 2e9:
                     self.log("Restoring unused space to DATA_STORE...")
-                    operations.updater.restore_data_partition(disk_id)
+                    updater.restore_data_partition(disk_id)
 
             self.log("Update Complete.")
             self.root.after(0, lambda: messagebox.showinfo("Success", "Update Complete"))
 
         except Exception as e:
             self.log(f"Error: {e}")
-            import traceback
             self.log(traceback.format_exc())
         finally:
             self.is_working = False
+            # The layout changed; don't serve the pre-run structure from cache
+            self._structure_cache.pop(disk_id, None)
             self.root.after(0, lambda: self.create_btn.config(state="normal"))
 
+    @staticmethod
+    def _install_volume_name(inst):
+        """Volume name the partitioner gives an installer's partition."""
+        os_name = constants.get_os_name(inst['version'], inst['name'])
+        version_clean = inst['version'].replace('.', '_').split()[0]
+        return f"INSTALL_{os_name}_{version_clean}"[:27]
+
     def run_creation_thread(self, disk_id, installers):
         try:
-            import safety.backup_manager
-            safety.backup_manager.backup_partition_table(disk_id)
-            for inst in installers:
-                branding.extract_icon_from_installer(inst['path'], inst['name'])
-            import operations.updater
-            struct = operations.updater.get_drive_structure(disk_id)
-            total_size_gb = struct['disk_size'] / 1e9 if struct else 0
-            self.log(f"Partitioning {disk_id}...")
-            success = partitioner.create_multiboot_layout(disk_id, installers, total_size_gb)
+            # Icon copies only read the source apps, so overlap them with partitioning;
+            # leaving the pool joins them before branding needs the cached icons
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as icon_pool:
+                for inst in installers:
+                    icon_pool.submit(branding.extract_icon_from_installer, inst['path'], inst['name'])
+                backup_manager.backup_partition_table(disk_id)
+                struct = updater.get_drive_structure(disk_id)
+                total_size_gb = struct['disk_size'] / 1e9 if struct else 0
+                self.log(f"Partitioning {disk_id}...")
+                success = partitioner.create_multiboot_layout(disk_id, installers, total_size_gb)
             if not success:
                 self.log("Partitioning failed.")
                 return
-            time.sleep(5)
+            # Wait for the first new volume to mount rather than a fixed delay
+            installer_runner.wait_for_mount(f"/Volumes/{self._install_volume_name(installers[0])}", timeout=10)
             current_partitions = partitioner.get_partition_list(disk_id)
             for inst in installers:
                 self.log(f"Installing {inst['name']}...")
                 os_name = constants.get_os_name(inst['version'], inst['name'])
-                version_clean = inst['version'].replace('.', '_').split()[0]
-                expected_vol_name = f"INSTALL_{os_name}_{version_clean}"[:27]
+                expected_vol_name = self._install_volume_name(inst)
                 target_part = next((p for p in current_partitions if p['name'] == expected_vol_name), None)
                 if not target_part:
                     time.sleep(2)
@@ -1377,8 +1614,7 @@ class MultiBootGUI:
                         time.sleep(1)
                         mount_point = installer_runner.get_volume_mount_point(disk_id, part_num)
                     if mount_point:
-                        def cb(p):
-                            if p%10==0: self.log(f"  {inst['name']}: {p}%")
+                        cb = self._progress_callback(inst['name'])
                         if installer_runner.run_createinstallmedia(inst['path'], mount_point, progress_callback=cb):
                             self.log("Success.")
                             new_mount = installer_runner.get_volume_mount_point(disk_id, part_num)
@@ -1389,10 +1625,11 @@ class MultiBootGUI:
             self.root.after(0, lambda: messagebox.showinfo("Success", "Complete"))
         except Exception as e:
             self.log(f"Error: {e}")
-            import traceback
             self.log(traceback.format_exc())
         finally:
             self.is_working = False
+            # The layout changed; don't serve the pre-run structure from cache
+            self._structure_cache.pop(disk_id, None)
             self.root.after(0, lambda: self.create_btn.config(state="normal"))
 
 def launch(config=None):
@@ -6,56 +6,48 @@ ONE RESPONSIBILITY: Handle text translation
 import locale
 import json
 import os
+import functools
 
 # Default language
 DEFAULT_LANG = "en"
 
-# Translation dictionary (Skeleton)
-# In a real app, this would be loaded from JSON files
-TRANSLATIONS = {
-    "en": {
-        "header_create": "CREATE NEW MULTI-BOOT USB",
-        "header_update": "UPDATE EXISTING MULTI-BOOT USB",
-        "error_root": "Root privileges required. Elevating...",
-        "error_no_installers": "No macOS installers found!",
-        "prompt_select_drive": "Select USB drive",
-        "confirm_erase": "Type 'ERASE' to confirm",
-    },
-    "es": {
-        "header_create": "CREAR NUEVO USB MULTI-ARRANQUE",
-        "header_update": "ACTUALIZAR USB MULTI-ARRANQUE EXISTENTE",
-        "error_root": "Se requieren privilegios de root. Elevando...",
-        "error_no_installers": "¡No se encontraron instaladores de macOS!",
-        "prompt_select_drive": "Seleccionar unidad USB",
-        "confirm_erase": "Escriba 'ERASE' para confirmar",
-    },
-    "fr": {
-        "header_create": "CRÉER UNE CLÉ USB MULTI-BOOT",
-        "header_update": "METTRE À JOUR LA CLÉ USB EXISTANTE",
-        "error_root": "Privilèges root requis. Élévation...",
-        "error_no_installers": "Aucun installateur macOS trouvé !",
-        "prompt_select_drive": "Sélectionner le disque USB",
-        "confirm_erase": "Tapez 'ERASE' pour confirmer",
-    }
-}
+# One <lang>.json per language; only the ones actually used get loaded
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
 
 CURRENT_LANG = DEFAULT_LANG
 
+# Language detection runs on first use, not at import
+_detected = False
+
+@functools.lru_cache(maxsize=None)
+def _load(lang):
+    """Load a language table, or {} if there is no file for it."""
+    path = os.path.join(LOCALES_DIR, f"{lang}.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 def detect_language():
     """Detect system language."""
-    global CURRENT_LANG
+    global CURRENT_LANG, _detected
+    _detected = True
     try:
-        sys_lang = locale.getdefaultlocale()[0]
+        # getdefaultlocale() is deprecated; read the environment it consulted,
+        # then whatever locale the interpreter started with
+        sys_lang = os.environ.get('LC_ALL') or os.environ.get('LC_MESSAGES') or os.environ.get('LANG')
+        if not sys_lang:
+            sys_lang = locale.getlocale()[0]
         if sys_lang:
-            lang_code = sys_lang.split('_')[0]
-            if lang_code in TRANSLATIONS:
+            lang_code = sys_lang.split('.')[0].split('_')[0]
+            if os.path.exists(os.path.join(LOCALES_DIR, f"{lang_code}.json")):
                 CURRENT_LANG = lang_code
     except:
         pass
 
 def t(key):
     """Translate a key."""
-    return TRANSLATIONS.get(CURRENT_LANG, TRANSLATIONS[DEFAULT_LANG]).get(key, key)
-
-# Auto-detect on import
-detect_language()
+    if not _detected:
+        detect_language()
+    return _load(CURRENT_LANG).get(key) or _load(DEFAULT_LANG).get(key, key)
@@ -6,8 +6,17 @@ ZERO BUGS: Safe terminal output with fallback
 
 import sys
 import time
+import threading
 
-def show_progress_bar(label, percent, start_time=None, width=40):
+# Decide once whether the terminal can show block characters
+_UNICODE = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "").startswith("utf")
+_FILL, _EMPTY = ("█", "░") if _UNICODE else ("#", "-")
+
+# Every possible bar for the default width, indexed by filled cells
+DEFAULT_BAR_WIDTH = 40
+_BARS = [_FILL * i + _EMPTY * (DEFAULT_BAR_WIDTH - i) for i in range(DEFAULT_BAR_WIDTH + 1)]
+
+def show_progress_bar(label, percent, start_time=None, width=DEFAULT_BAR_WIDTH):
     """
     Display progress bar with optional ETA.
 
@@ -24,31 +33,26 @@ def show_progress_bar(label, percent, start_time=None, width=40):
     filled = int(width * percent / 100)
 
     # Build bar
-    try:
-        bar = "█" * filled + "░" * (width - filled)
-    except UnicodeEncodeError:
-        # Fallback for terminals without Unicode
-        bar = "#" * filled + "-" * (width - filled)
+    if width == DEFAULT_BAR_WIDTH:
+        bar = _BARS[filled]
+    else:
+        bar = _FILL * filled + _EMPTY * (width - filled)
 
     # Calculate ETA
     eta_str = ""
     if start_time and percent > 5:  # Wait for 5% before showing ETA
         elapsed = time.time() - start_time
-        if percent > 0:
-            total_estimated = (elapsed / percent) * 100
-            remaining = total_estimated - elapsed
-
-            # Format ETA
-            if remaining < 60:
-                eta_str = f" | ETA: {int(remaining)}s"
-            else:
-                minutes = int(remaining / 60)
-                seconds = int(remaining % 60)
-                eta_str = f" | ETA: {minutes}m {seconds}s"
+        remaining = int(elapsed * (100 - percent) / percent)
+
+        # Format ETA
+        minutes, seconds = divmod(remaining, 60)
+        if minutes:
+            eta_str = " | ETA: %dm %ds" % (minutes, seconds)
+        else:
+            eta_str = " | ETA: %ds" % seconds
 
     # Output
-    output = f"\r{label}: [{bar}] {percent:3d}%{eta_str}"
-    sys.stdout.write(output)
+    sys.stdout.write("\r%s: [%s] %3d%%%s" % (label, bar, percent, eta_str))
     sys.stdout.flush()
 
     # Newline when complete
@@ -56,29 +60,44 @@ def show_progress_bar(label, percent, start_time=None, width=40):
         print()
 
 class Spinner:
-    """Simple text spinner for indefinite operations."""
+    """Simple text spinner for indefinite operations, animated at 10 Hz."""
 
     def __init__(self, message="Working"):
         self.message = message
         self.frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.current = 0
         self.running = False
+        self._stop = threading.Event()
+        self._thread = None
 
     def start(self):
-        """Start spinner."""
+        """Start spinner on a background thread so it animates while the caller blocks."""
+        if self.running:
+            return
         self.running = True
+        self._stop.clear()
         self._spin()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
 
     def stop(self, final_message=None):
         """Stop spinner and optionally show final message."""
         self.running = False
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=0.5)
+            self._thread = None
         sys.stdout.write('\r' + ' ' * 80 + '\r')  # Clear line
         if final_message:
             print(final_message)
         sys.stdout.flush()
 
+    def _run(self):
+        while not self._stop.wait(0.1):
+            self._spin()
+
     def _spin(self):
-        """Internal spin method."""
+        """Draw the next frame."""
         if not self.running:
             return
 
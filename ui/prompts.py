@@ -4,9 +4,60 @@ ONE RESPONSIBILITY: Get user input safely
 ZERO BUGS: Input validation and error handling
 """
 
+import os
+import shutil
 import sys
 from ui.display import Colors
 
+try:
+    import termios
+    import tty
+except ImportError:  # not a POSIX terminal
+    termios = None
+
+# Fixed colored segments, built once (Colors is already blanked for non-TTYs)
+_SEPARATOR = "=" * 60
+_WARN_BAR = f"{Colors.RED}{Colors.BOLD}{_SEPARATOR}{Colors.END}"
+_WARN_HDR = f"{Colors.RED}{Colors.BOLD}⚠️  CRITICAL WARNING - DATA WILL BE DESTROYED ⚠️{Colors.END}"
+_WARN_FOOTER = (f"\n{Colors.RED}THIS ACTION CANNOT BE UNDONE!{Colors.END}\n"
+                f"{Colors.RED}ALL DATA ON THIS DISK WILL BE PERMANENTLY LOST!{Colors.END}\n")
+_ERASE_PROMPT = f"Type '{Colors.BOLD}ERASE{Colors.END}' to confirm: "
+_NONE_SELECTED = f"{Colors.YELLOW}No installers selected!{Colors.END}"
+_INVALID_NUMBER = f"{Colors.RED}Invalid number{Colors.END}"
+_INVALID_INPUT = f"{Colors.RED}Invalid input{Colors.END}"
+_TOGGLE_PROMPT = "\nToggle [1-9], 'a'll, 'n'one, or 'd'one: "
+
+def _getch():
+    """Read one keypress from the terminal without waiting for Enter."""
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        # cbreak keeps Ctrl+C working; read the fd directly so no bytes are
+        # left in sys.stdin's buffer for a later input()
+        tty.setcbreak(fd)
+        ch = os.read(fd, 1).decode('utf-8', 'replace')
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    if ch in ("", "\x04"):
+        raise EOFError
+    return ch
+
+def _read_toggle(single_key):
+    """
+    Read one answer to the toggle prompt, lowercased.
+
+    With `single_key` the first keypress is the answer and is echoed with a
+    newline, leaving the screen exactly as input() would.
+    """
+    if not single_key:
+        return input(_TOGGLE_PROMPT).strip().lower()
+    sys.stdout.write(_TOGGLE_PROMPT)
+    sys.stdout.flush()
+    ch = _getch()
+    sys.stdout.write(ch.strip() + "\n")
+    sys.stdout.flush()
+    return ch.strip().lower()
+
 def prompt_yes_no(question, default='n'):
     """
     Ask yes/no question.
@@ -120,20 +171,17 @@ def confirm_destructive_action(disk_id, disk_name, disk_size_gb):
     Returns:
         bool: True if user confirms
     """
-    print(f"\n{Colors.RED}{Colors.BOLD}{'='*60}{Colors.END}")
-    print(f"{Colors.RED}{Colors.BOLD}⚠️  CRITICAL WARNING - DATA WILL BE DESTROYED ⚠️{Colors.END}")
-    print(f"{Colors.RED}{Colors.BOLD}{'='*60}{Colors.END}\n")
+    print(f"\n{_WARN_BAR}\n{_WARN_HDR}\n{_WARN_BAR}\n")
 
     print(f"About to ERASE ALL DATA on:")
     print(f"  Disk ID:   {Colors.BOLD}/dev/{disk_id}{Colors.END}")
     print(f"  Name:      {Colors.BOLD}{disk_name}{Colors.END}")
     print(f"  Size:      {Colors.BOLD}{disk_size_gb:.2f} GB{Colors.END}")
 
-    print(f"\n{Colors.RED}THIS ACTION CANNOT BE UNDONE!{Colors.END}")
-    print(f"{Colors.RED}ALL DATA ON THIS DISK WILL BE PERMANENTLY LOST!{Colors.END}\n")
+    print(_WARN_FOOTER)
 
     try:
-        confirmation = input(f"Type '{Colors.BOLD}ERASE{Colors.END}' to confirm: ").strip()
+        confirmation = input(_ERASE_PROMPT).strip()
         return confirmation == "ERASE"
 
     except (KeyboardInterrupt, EOFError):
@@ -154,47 +202,89 @@ def prompt_installer_selection(installers):
         return []
 
     # All selected by default
-    selected = [True] * len(installers)
+    count = len(installers)
+    selected = [True] * count
+
+    # Redraw only what changed when the terminal understands cursor movement
+    # and the whole menu (rows plus 6 lines of chrome) is on screen
+    incremental = sys.stdout.isatty() and count + 6 < shutil.get_terminal_size().lines
+    full_redraw = True
+    # Every choice is a single key unless there are two-digit rows to pick
+    single_key = termios is not None and count <= 9 and sys.stdin.isatty()
 
     print("\nUse number to toggle, 'a' for all, 'n' for none, 'd' when done:")
 
     while True:
-        # Display current selection
-        print("\n" + "="*60)
-        for i, inst in enumerate(installers):
-            marker = "✓" if selected[i] else " "
-            print(f"  [{marker}] {i+1}. {inst['name']} ({inst['version']})")
-        print("="*60)
-
-        # Show summary
         selected_count = sum(selected)
-        print(f"\nSelected: {selected_count}/{len(installers)}")
+
+        if full_redraw:
+            # Display current selection and summary in one write
+            lines = ["", _SEPARATOR]
+            lines.extend(_selection_row(i, inst, selected[i]) for i, inst in enumerate(installers))
+            lines += [_SEPARATOR, "", f"Selected: {selected_count}/{count}"]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        full_redraw = not incremental
 
         try:
-            choice = input("\nToggle [1-9], 'a'll, 'n'one, or 'd'one: ").strip().lower()
+            choice = _read_toggle(single_key)
 
             if choice == 'd':
                 if selected_count == 0:
-                    print(f"{Colors.YELLOW}No installers selected!{Colors.END}")
+                    print(_NONE_SELECTED)
+                    full_redraw = True
                     continue
                 return [i for i, sel in enumerate(selected) if sel]
 
             elif choice == 'a':
-                selected = [True] * len(installers)
+                selected = [True] * count
+                changed = range(count)
 
             elif choice == 'n':
-                selected = [False] * len(installers)
+                selected = [False] * count
+                changed = range(count)
 
             elif choice.isdigit():
                 idx = int(choice) - 1
-                if 0 <= idx < len(installers):
+                if 0 <= idx < count:
                     selected[idx] = not selected[idx]
+                    changed = (idx,)
                 else:
-                    print(f"{Colors.RED}Invalid number{Colors.END}")
+                    print(_INVALID_NUMBER)
+                    full_redraw = True
+                    continue
 
             else:
-                print(f"{Colors.RED}Invalid input{Colors.END}")
+                print(_INVALID_INPUT)
+                full_redraw = True
+                continue
+
+            if incremental:
+                _redraw_selection(installers, selected, changed)
 
         except (KeyboardInterrupt, EOFError):
             print()
             return []
+
+def _selection_row(i, inst, is_selected):
+    marker = "✓" if is_selected else " "
+    return f"  [{marker}] {i+1}. {inst['name']} ({inst['version']})"
+
+def _redraw_selection(installers, selected, changed):
+    """
+    Rewrite changed rows and the summary in place with ANSI cursor moves.
+
+    Called with the cursor just below the prompt line. Below row i sit the
+    remaining rows, the separator, a blank, the summary, a blank and the
+    prompt, so row i is (count - i + 5) lines up and the summary 3 lines up.
+    """
+    count = len(installers)
+    out = []
+    for i in changed:
+        up = count - i + 5
+        out.append(f"\x1b[{up}A\r\x1b[2K{_selection_row(i, installers[i], selected[i])}\x1b[{up}B\r")
+    out.append(f"\x1b[3A\r\x1b[2KSelected: {sum(selected)}/{count}\x1b[3B\r")
+    # Clear the answered prompt and step back to the blank line above it
+    out.append("\x1b[1A\x1b[2K\x1b[1A\r")
+    sys.stdout.write("".join(out))
+    sys.stdout.flush()
@@ -3,16 +3,190 @@ logger.py - Logging system for debugging
 ONE RESPONSIBILITY: Log operations
 """
 
+import atexit
+import io
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 
 LOG_DIR = "/tmp/multiboot_logs"
 LOG_FILE = None
 
+# Seconds between background flushes of the buffered log file
+FLUSH_INTERVAL = 1.0
+
+# Records the verbose console may fall behind by before the oldest are dropped
+CONSOLE_QUEUE_SIZE = 10000
+# Minimum seconds between "records dropped" notices on the console
+DROP_REPORT_INTERVAL = 5.0
+
+_flusher_stop = None
+_listener = None # QueueListener doing the actual I/O off the calling threads
+_console_listener = None # Separate, lossy listener for the verbose console
+
+_LOGGER = logging.getLogger()
+# Level switches for the log_* helpers, refreshed by setup_logging(); until
+# then everything is passed through to the logging module's own checks
+_INFO_ON = True
+_WARNING_ON = True
+_ERROR_ON = True
+
+class DropOldestQueue(queue.Queue):
+    """
+    Bounded queue whose put() never blocks: when full, the oldest entry
+    is discarded to make room and counted in `dropped`.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__(maxsize)
+        self.dropped = 0
+
+    def put(self, item, block=True, timeout=None):
+        while True:
+            try:
+                super().put(item, block=False)
+                return
+            except queue.Full:
+                try:
+                    self.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+class ConsoleListener(logging.handlers.QueueListener):
+    """QueueListener that reports records its DropOldestQueue had to discard."""
+
+    def __init__(self, queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self._last_report = 0.0
+
+    def dequeue(self, block):
+        record = super().dequeue(block)
+        dropped = self.queue.dropped
+        if dropped and record is not self._sentinel:
+            now = time.monotonic()
+            if now - self._last_report >= DROP_REPORT_INTERVAL:
+                self._last_report = now
+                self.queue.dropped -= dropped
+                self.handle(logging.makeLogRecord({
+                    'msg': f"{dropped} log records dropped (console too slow)",
+                    'levelno': logging.WARNING,
+                    'levelname': 'WARNING',
+                }))
+        return record
+
+class BufferedFileHandler(logging.StreamHandler):
+    """
+    File handler that coalesces records into 8 KiB writes.
+
+    A background thread flushes every FLUSH_INTERVAL seconds, and ERROR
+    records are flushed immediately so crash diagnostics reach the disk.
+    """
+
+    def __init__(self, path, buffer_size=8192):
+        # O_APPEND makes every flushed block land at the current end of file,
+        # even if another process (e.g. a sudo re-exec) appends to the same log
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0), 0o644)
+        raw = io.FileIO(fd, 'wb', closefd=True)
+        super().__init__(io.BufferedWriter(raw, buffer_size=buffer_size))
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record).encode('utf-8', 'replace') + b"\n")
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream:
+                try:
+                    self.stream.flush()
+                finally:
+                    self.stream.close()
+                    self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+class FastFormatter(logging.Formatter):
+    """
+    Produces '%(asctime)s - %(levelname)s - %(message)s' cheaply.
+
+    The date part only goes through strftime once per second; the line
+    itself is built with an f-string instead of %-substitution.
+    """
+
+    def __init__(self):
+        super().__init__('%(asctime)s - %(levelname)s - %(message)s')
+        # One tuple so threads sharing the formatter never pair a second
+        # with another second's stamp
+        self._last = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        last_second, stamp = self._last
+        if second != last_second:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", self.converter(second))
+            self._last = (second, stamp)
+        return "%s,%03d" % (stamp, record.msecs)
+
+    def format(self, record):
+        line = f"{self.formatTime(record)} - {record.levelname} - {record.getMessage()}"
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line = f"{line}\n{record.exc_text}"
+        if record.stack_info:
+            line = f"{line}\n{self.formatStack(record.stack_info)}"
+        return line
+
+def _start_flusher(*handlers):
+    """Flush `handlers` in order, periodically, from a daemon thread."""
+    global _flusher_stop
+    if _flusher_stop:
+        _flusher_stop.set()
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(FLUSH_INTERVAL):
+            for handler in handlers:
+                handler.flush()
+
+    threading.Thread(target=run, name="log-flusher", daemon=True).start()
+    _flusher_stop = stop
+
+def shutdown():
+    """Drain queued records, then flush and close the log handlers."""
+    global _listener, _console_listener, _flusher_stop
+    if _flusher_stop:
+        _flusher_stop.set()
+        _flusher_stop = None
+    # The main listener feeds the console one, so it has to drain first
+    for listener in (_listener, _console_listener):
+        if not listener:
+            continue
+        listener.stop()
+        for handler in listener.handlers:
+            # MemoryHandler.close() flushes into its target but leaves it open
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if isinstance(target, logging.Handler):
+                target.close()
+    _listener = None
+    _console_listener = None
+
+atexit.register(shutdown)
+
 def setup_logging(verbose=False):
     """Initialize logging system."""
-    global LOG_FILE
+    global LOG_FILE, _listener, _console_listener, _INFO_ON, _WARNING_ON, _ERROR_ON
 
     # Create log directory
     os.makedirs(LOG_DIR, exist_ok=True)
@@ -24,29 +198,70 @@ def setup_logging(verbose=False):
     # Configure logging
     level = logging.DEBUG if verbose else logging.INFO
 
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(LOG_FILE),
-            logging.StreamHandler() if verbose else logging.NullHandler()
-        ]
-    )
+    # Records never use thread/process/caller fields; skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+    # Outside debug runs, a failing handler shouldn't print tracebacks mid-UI
+    logging.raiseExceptions = verbose
+
+    formatter = FastFormatter()
+    file_handler = BufferedFileHandler(LOG_FILE)
+    file_handler.setFormatter(formatter)
+    # Batch records in memory; an ERROR pushes everything pending to the file at once
+    mem_handler = logging.handlers.MemoryHandler(
+        capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+    handlers = [mem_handler]
+
+    # Callers only enqueue records; a listener thread formats and writes them
+    shutdown()
+    if verbose:
+        console = logging.StreamHandler()
+        console.setFormatter(formatter)
+        # A slow terminal may lose console lines but never stalls the file log
+        console_queue = DropOldestQueue(CONSOLE_QUEUE_SIZE)
+        _console_listener = ConsoleListener(console_queue, console)
+        _console_listener.start()
+        handlers.append(logging.handlers.QueueHandler(console_queue))
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _start_flusher(mem_handler, file_handler)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Only merge args here; timestamps and levels are formatted by the listener
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    # force: replace the handler of an earlier call, whose listener is stopped
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+
+    _INFO_ON = _LOGGER.isEnabledFor(logging.INFO)
+    _WARNING_ON = _LOGGER.isEnabledFor(logging.WARNING)
+    _ERROR_ON = _LOGGER.isEnabledFor(logging.ERROR)
 
     logging.info(f"Logging started - {timestamp}")
     return LOG_FILE
 
 def log_info(message):
     """Log info message."""
-    logging.info(message)
+    if _INFO_ON:
+        _LOGGER.info(message)
+
+def log_info_lazy(fmt, *args):
+    """Log info message, %-formatting `args` only if INFO is enabled."""
+    if _INFO_ON:
+        _LOGGER.info(fmt, *args)
 
 def log_error(message):
     """Log error message."""
-    logging.error(message)
+    if _ERROR_ON:
+        _LOGGER.error(message)
 
 def log_warning(message):
     """Log warning message."""
-    logging.warning(message)
+    if _WARNING_ON:
+        _LOGGER.warning(message)
 
 def get_log_file():
     """Get current log file path."""